@@ -318,11 +318,13 @@ class HistoricalDataFetcher:
     ) -> dict[str, HistoricalReference]:
         """Convenience method: fetch prev day data + ADV, build HistoricalReference map.
 
-        Runs sequentially (not concurrently) because both methods share
-        the same Angel One rate limit (3 req/s, 180 req/min).
+        Both passes run concurrently; every Angel One request goes through the
+        shared token-bucket limiter, so together they stay within the API budget.
         """
-        prev_data = await self.fetch_previous_day_data()
-        adv_data = await self.fetch_average_daily_volume()
+        prev_data, adv_data = await asyncio.gather(
+            self.fetch_previous_day_data(),
+            self.fetch_average_daily_volume(),
+        )
 
         refs: dict[str, HistoricalReference] = {}
         for symbol in self._instruments.symbols:
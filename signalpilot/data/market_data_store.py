@@ -34,6 +34,11 @@ class MarketDataStore:
         async with self._lock:
             self._historical[symbol] = data
 
+    async def set_historical_many(self, refs: dict[str, HistoricalReference]) -> None:
+        """Set historical reference data for many symbols under one lock acquisition."""
+        async with self._lock:
+            self._historical.update(refs)
+
     async def get_historical(self, symbol: str) -> HistoricalReference | None:
         """Get historical reference data for a symbol."""
         async with self._lock:
@@ -25,11 +25,13 @@ class WebSocketClient:
         market_data_store: MarketDataStore,
         on_disconnect_alert: Callable[[str], Awaitable[None]],
         max_reconnect_attempts: int = 3,
+        on_tick: Callable[[], None] | None = None,
     ) -> None:
         self._auth = authenticator
         self._instruments = instruments
         self._store = market_data_store
         self._on_disconnect_alert = on_disconnect_alert
+        self._on_tick = on_tick
         self._max_reconnect_attempts = max_reconnect_attempts
         self._ws: SmartWebSocketV2 | None = None
         self._reconnect_count = 0
@@ -105,9 +107,11 @@ class WebSocketClient:
             logger.exception("Error parsing tick data from message: %s", message)
 
     async def _update_store(self, symbol: str, tick: TickData) -> None:
-        """Update the market data store with a new tick."""
+        """Update the market data store with a new tick, then notify the listener."""
         await self._store.update_tick(symbol, tick)
         await self._store.accumulate_volume(symbol, tick.volume)
+        if self._on_tick is not None:
+            self._on_tick()
 
     def _on_close(self, ws, code, reason) -> None:
         """Callback for connection close. Triggers reconnection."""
@@ -1,5 +1,6 @@
 """Repository for user configuration."""
 
+import time
 from datetime import datetime
 
 import aiosqlite
@@ -10,18 +11,38 @@ from signalpilot.db.models import UserConfig
 class ConfigRepository:
     """CRUD operations for the user_config table."""
 
-    def __init__(self, connection: aiosqlite.Connection) -> None:
+    def __init__(self, connection: aiosqlite.Connection, cache_ttl: float = 0.0) -> None:
         self._conn = connection
+        self._cache_ttl = cache_ttl
+        self._cached_config: UserConfig | None = None
+        self._cached_at = 0.0
 
     async def get_user_config(self) -> UserConfig | None:
-        """Return the current user config, or None if no config exists."""
+        """Return the current user config, or None if no config exists.
+
+        When ``cache_ttl`` is positive the last config read is reused for that many
+        seconds. Writes through this repository invalidate the cache immediately.
+        """
+        if (
+            self._cached_config is not None
+            and time.monotonic() - self._cached_at < self._cache_ttl
+        ):
+            return self._cached_config
         cursor = await self._conn.execute(
             "SELECT * FROM user_config ORDER BY id LIMIT 1",
         )
         row = await cursor.fetchone()
         if row is None:
             return None
-        return self._row_to_config(row)
+        config = self._row_to_config(row)
+        if self._cache_ttl > 0:
+            self._cached_config = config
+            self._cached_at = time.monotonic()
+        return config
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached config so the next read goes to the database."""
+        self._cached_config = None
 
     async def initialize_default(
         self,
@@ -31,6 +52,7 @@ class ConfigRepository:
     ) -> UserConfig:
         """Create or update default config. Returns the config."""
         now = datetime.now().isoformat()
+        self.invalidate_cache()
         existing = await self.get_user_config()
         if existing is None:
             await self._conn.execute(
@@ -51,6 +73,7 @@ class ConfigRepository:
                 (telegram_chat_id, total_capital, max_positions, now, existing.id),
             )
         await self._conn.commit()
+        self.invalidate_cache()
         return await self.get_user_config()
 
     async def update_capital(self, total_capital: float) -> None:
@@ -61,6 +84,7 @@ class ConfigRepository:
             (total_capital, now),
         )
         await self._conn.commit()
+        self.invalidate_cache()
         if cursor.rowcount == 0:
             raise RuntimeError("No user config exists. Call initialize_default() first.")
 
@@ -72,6 +96,7 @@ class ConfigRepository:
             (max_positions, now),
         )
         await self._conn.commit()
+        self.invalidate_cache()
         if cursor.rowcount == 0:
             raise RuntimeError("No user config exists. Call initialize_default() first.")
 
@@ -1,5 +1,6 @@
 """Metrics calculator for performance reporting."""
 
+import asyncio
 from datetime import date
 
 import aiosqlite
@@ -26,38 +27,37 @@ class MetricsCalculator:
         A "win" is pnl_amount > 0, a "loss" is pnl_amount <= 0 (Req 30.3).
         """
         if date_start and date_end:
-            query = """
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN pnl_amount > 0 THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN pnl_amount <= 0 THEN 1 ELSE 0 END) as losses,
-                    COALESCE(SUM(pnl_amount), 0.0) as total_pnl,
-                    AVG(CASE WHEN pnl_amount > 0 THEN pnl_amount END) as avg_win,
-                    AVG(CASE WHEN pnl_amount <= 0 THEN pnl_amount END) as avg_loss,
-                    MAX(pnl_amount) as best_pnl,
-                    MIN(pnl_amount) as worst_pnl
-                FROM trades
-                WHERE exited_at IS NOT NULL AND date BETWEEN ? AND ?
-            """
-            cursor = await self._conn.execute(
-                query, (date_start.isoformat(), date_end.isoformat())
-            )
+            trade_range = " AND date BETWEEN ? AND ?"
+            signal_range = " WHERE date BETWEEN ? AND ?"
+            range_params: tuple[str, ...] = (date_start.isoformat(), date_end.isoformat())
         else:
-            query = """
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN pnl_amount > 0 THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN pnl_amount <= 0 THEN 1 ELSE 0 END) as losses,
-                    COALESCE(SUM(pnl_amount), 0.0) as total_pnl,
-                    AVG(CASE WHEN pnl_amount > 0 THEN pnl_amount END) as avg_win,
-                    AVG(CASE WHEN pnl_amount <= 0 THEN pnl_amount END) as avg_loss,
-                    MAX(pnl_amount) as best_pnl,
-                    MIN(pnl_amount) as worst_pnl
-                FROM trades
-                WHERE exited_at IS NOT NULL
-            """
-            cursor = await self._conn.execute(query)
-
+            trade_range = ""
+            signal_range = ""
+            range_params = ()
+
+        # One round-trip: trade aggregates, best/worst symbols and the signal
+        # count are all computed by SQLite in a single statement.
+        query = f"""
+            SELECT
+                COUNT(*) as total,
+                SUM(CASE WHEN pnl_amount > 0 THEN 1 ELSE 0 END) as wins,
+                SUM(CASE WHEN pnl_amount <= 0 THEN 1 ELSE 0 END) as losses,
+                COALESCE(SUM(pnl_amount), 0.0) as total_pnl,
+                AVG(CASE WHEN pnl_amount > 0 THEN pnl_amount END) as avg_win,
+                AVG(CASE WHEN pnl_amount <= 0 THEN pnl_amount END) as avg_loss,
+                MAX(pnl_amount) as best_pnl,
+                MIN(pnl_amount) as worst_pnl,
+                (SELECT symbol FROM trades
+                 WHERE exited_at IS NOT NULL{trade_range}
+                 ORDER BY pnl_amount DESC LIMIT 1) as best_symbol,
+                (SELECT symbol FROM trades
+                 WHERE exited_at IS NOT NULL{trade_range}
+                 ORDER BY pnl_amount ASC LIMIT 1) as worst_symbol,
+                (SELECT COUNT(*) FROM signals{signal_range}) as total_signals
+            FROM trades
+            WHERE exited_at IS NOT NULL{trade_range}
+        """
+        cursor = await self._conn.execute(query, range_params * 4)
         row = await cursor.fetchone()
 
         total = row["total"] or 0
@@ -68,54 +68,16 @@ class MetricsCalculator:
         avg_loss = row["avg_loss"] or 0.0
         best_pnl = row["best_pnl"] or 0.0
         worst_pnl = row["worst_pnl"] or 0.0
+        best_symbol = row["best_symbol"] or ""
+        worst_symbol = row["worst_symbol"] or ""
+        total_signals = row["total_signals"] or 0
 
         win_rate = (wins / total * 100) if total > 0 else 0.0
         risk_reward = abs(avg_win / avg_loss) if avg_loss != 0 else 0.0
 
-        # Find best/worst trade symbols (respecting date range)
-        best_symbol = ""
-        worst_symbol = ""
-        if total > 0:
-            if date_start and date_end:
-                best_cursor = await self._conn.execute(
-                    "SELECT symbol FROM trades WHERE exited_at IS NOT NULL AND date BETWEEN ? AND ? ORDER BY pnl_amount DESC LIMIT 1",
-                    (date_start.isoformat(), date_end.isoformat()),
-                )
-            else:
-                best_cursor = await self._conn.execute(
-                    "SELECT symbol FROM trades WHERE exited_at IS NOT NULL ORDER BY pnl_amount DESC LIMIT 1"
-                )
-            best_row = await best_cursor.fetchone()
-            if best_row:
-                best_symbol = best_row["symbol"]
-
-            if date_start and date_end:
-                worst_cursor = await self._conn.execute(
-                    "SELECT symbol FROM trades WHERE exited_at IS NOT NULL AND date BETWEEN ? AND ? ORDER BY pnl_amount ASC LIMIT 1",
-                    (date_start.isoformat(), date_end.isoformat()),
-                )
-            else:
-                worst_cursor = await self._conn.execute(
-                    "SELECT symbol FROM trades WHERE exited_at IS NOT NULL ORDER BY pnl_amount ASC LIMIT 1"
-                )
-            worst_row = await worst_cursor.fetchone()
-            if worst_row:
-                worst_symbol = worst_row["symbol"]
-
         effective_start = date_start or date.today()
         effective_end = date_end or date.today()
 
-        # Count total signals in the date range
-        if date_start and date_end:
-            sig_cursor = await self._conn.execute(
-                "SELECT COUNT(*) FROM signals WHERE date BETWEEN ? AND ?",
-                (date_start.isoformat(), date_end.isoformat()),
-            )
-        else:
-            sig_cursor = await self._conn.execute("SELECT COUNT(*) FROM signals")
-        sig_row = await sig_cursor.fetchone()
-        total_signals = sig_row[0] or 0
-
         return PerformanceMetrics(
             date_range_start=effective_start,
             date_range_end=effective_end,
@@ -136,31 +98,37 @@ class MetricsCalculator:
 
     async def calculate_daily_summary(self, d: date) -> DailySummary:
         """Calculate the daily summary for the given date."""
-        trades = await self._trade_repo.get_trades_by_date(d)
-
-        # Count signals for the day
-        sig_cursor = await self._conn.execute(
-            "SELECT COUNT(*) FROM signals WHERE date = ?",
-            (d.isoformat(),),
-        )
-        sig_row = await sig_cursor.fetchone()
-        signals_sent = sig_row[0] or 0
-
-        closed_trades = [t for t in trades if t.exited_at is not None]
-        wins = sum(1 for t in closed_trades if t.pnl_amount is not None and t.pnl_amount > 0)
-        losses = sum(1 for t in closed_trades if t.pnl_amount is not None and t.pnl_amount <= 0)
-        total_pnl = sum(t.pnl_amount for t in closed_trades if t.pnl_amount is not None)
-
-        # Cumulative P&L: sum of all closed trades up to and including this date
-        cum_cursor = await self._conn.execute(
-            """
-            SELECT COALESCE(SUM(pnl_amount), 0.0) FROM trades
-            WHERE exited_at IS NOT NULL AND date <= ?
-            """,
-            (d.isoformat(),),
+        # The three reads are independent; issue them together rather than
+        # waiting on each round-trip in turn.
+        trades, signals_sent, cumulative_pnl = await asyncio.gather(
+            self._trade_repo.get_trades_by_date(d),
+            self._fetch_scalar(
+                "SELECT COUNT(*) FROM signals WHERE date = ?",
+                (d.isoformat(),),
+            ),
+            # Cumulative P&L: sum of all closed trades up to and including this date
+            self._fetch_scalar(
+                """
+                SELECT COALESCE(SUM(pnl_amount), 0.0) FROM trades
+                WHERE exited_at IS NOT NULL AND date <= ?
+                """,
+                (d.isoformat(),),
+            ),
         )
-        cum_row = await cum_cursor.fetchone()
-        cumulative_pnl = cum_row[0] or 0.0
+        signals_sent = signals_sent or 0
+        cumulative_pnl = cumulative_pnl or 0.0
+
+        # Tally wins, losses and P&L for closed trades in a single pass
+        wins = losses = 0
+        total_pnl = 0
+        for t in trades:
+            if t.exited_at is None or t.pnl_amount is None:
+                continue
+            total_pnl += t.pnl_amount
+            if t.pnl_amount > 0:
+                wins += 1
+            else:
+                losses += 1
 
         return DailySummary(
             date=d,
@@ -172,3 +140,9 @@ class MetricsCalculator:
             cumulative_pnl=cumulative_pnl,
             trades=trades,
         )
+
+    async def _fetch_scalar(self, query: str, params: tuple) -> object:
+        """Execute a single-value query and return its first column."""
+        cursor = await self._conn.execute(query, params)
+        row = await cursor.fetchone()
+        return row[0]
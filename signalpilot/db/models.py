@@ -120,7 +120,7 @@ class PreviousDayData:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CandidateSignal:
     """A raw signal produced by a strategy before ranking and filtering."""
 
@@ -152,7 +152,7 @@ class ScoringWeights:
     price_distance_weight: float = 0.25
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RankedSignal:
     """A candidate signal that has been scored and ranked."""
 
@@ -167,7 +167,7 @@ class RankedSignal:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSize:
     """Result of position sizing calculation."""
 
@@ -176,7 +176,7 @@ class PositionSize:
     per_trade_capital: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinalSignal:
     """A fully processed signal ready for delivery via Telegram."""
 
@@ -191,7 +191,7 @@ class FinalSignal:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalRecord:
     """Persistent record for the signals table."""
 
@@ -8,6 +8,14 @@ from signalpilot.db.models import SignalRecord
 
 _VALID_STATUSES = frozenset({"sent", "taken", "expired"})
 
+_INSERT_SIGNAL_SQL = """
+    INSERT INTO signals
+        (date, symbol, strategy, entry_price, stop_loss, target_1,
+         target_2, quantity, capital_required, signal_strength,
+         gap_pct, volume_ratio, reason, created_at, expires_at, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class SignalRepository:
     """CRUD operations for the signals table."""
@@ -17,38 +25,27 @@ class SignalRepository:
 
     async def insert_signal(self, signal: SignalRecord) -> int:
         """Insert a signal record and return the new row ID."""
-        cursor = await self._conn.execute(
-            """
-            INSERT INTO signals
-                (date, symbol, strategy, entry_price, stop_loss, target_1,
-                 target_2, quantity, capital_required, signal_strength,
-                 gap_pct, volume_ratio, reason, created_at, expires_at, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                signal.date.isoformat(),
-                signal.symbol,
-                signal.strategy,
-                signal.entry_price,
-                signal.stop_loss,
-                signal.target_1,
-                signal.target_2,
-                signal.quantity,
-                signal.capital_required,
-                signal.signal_strength,
-                signal.gap_pct,
-                signal.volume_ratio,
-                signal.reason,
-                signal.created_at.isoformat() if signal.created_at else datetime.now().isoformat(),
-                signal.expires_at.isoformat() if signal.expires_at else datetime.now().isoformat(),
-                signal.status,
-            ),
-        )
+        cursor = await self._conn.execute(_INSERT_SIGNAL_SQL, self._record_params(signal))
         await self._conn.commit()
         row_id = cursor.lastrowid
         assert row_id is not None, "INSERT did not return a row ID"
         return row_id
 
+    async def insert_signals(self, signals: list[SignalRecord]) -> list[int]:
+        """Insert several signal records in one transaction and return their row IDs.
+
+        IDs are returned in the same order as *signals*.
+        """
+        row_ids: list[int] = []
+        for signal in signals:
+            cursor = await self._conn.execute(_INSERT_SIGNAL_SQL, self._record_params(signal))
+            row_id = cursor.lastrowid
+            assert row_id is not None, "INSERT did not return a row ID"
+            row_ids.append(row_id)
+        if row_ids:
+            await self._conn.commit()
+        return row_ids
+
     async def update_status(self, signal_id: int, status: str) -> None:
         """Update the status of a signal (e.g., 'sent' -> 'expired')."""
         if status not in _VALID_STATUSES:
@@ -114,6 +111,28 @@ class SignalRepository:
         row = await cursor.fetchone()
         return self._row_to_record(row) if row else None
 
+    @staticmethod
+    def _record_params(signal: SignalRecord) -> tuple:
+        """Build the INSERT parameter tuple for a signal record."""
+        return (
+            signal.date.isoformat(),
+            signal.symbol,
+            signal.strategy,
+            signal.entry_price,
+            signal.stop_loss,
+            signal.target_1,
+            signal.target_2,
+            signal.quantity,
+            signal.capital_required,
+            signal.signal_strength,
+            signal.gap_pct,
+            signal.volume_ratio,
+            signal.reason,
+            signal.created_at.isoformat() if signal.created_at else datetime.now().isoformat(),
+            signal.expires_at.isoformat() if signal.expires_at else datetime.now().isoformat(),
+            signal.status,
+        )
+
     @staticmethod
     def _row_to_record(row: aiosqlite.Row) -> SignalRecord:
         """Convert a database row to a SignalRecord."""
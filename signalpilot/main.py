@@ -44,7 +44,7 @@ async def create_app(config: AppConfig) -> SignalPilotApp:
     # --- Repositories ---
     signal_repo = SignalRepository(connection)
     trade_repo = TradeRepository(connection)
-    config_repo = ConfigRepository(connection)
+    config_repo = ConfigRepository(connection, cache_ttl=10.0)
     metrics_calculator = MetricsCalculator(connection)
 
     # --- Data layer (no DB deps) ---
@@ -99,19 +99,26 @@ async def create_app(config: AppConfig) -> SignalPilotApp:
     )
     bot_ref[0] = bot  # complete the circular reference
 
-    # --- WebSocket ---
+    # --- WebSocket (wakes the scan loop on new ticks — closure breaks the cycle) ---
+    app_ref: list[SignalPilotApp | None] = [None]
+
+    def _tick_callback() -> None:
+        if app_ref[0] is not None:
+            app_ref[0].notify_tick()
+
     websocket = WebSocketClient(
         authenticator=authenticator,
         instruments=instruments,
         market_data_store=market_data,
         on_disconnect_alert=bot.send_alert,
         max_reconnect_attempts=config.ws_max_reconnect_attempts,
+        on_tick=_tick_callback,
     )
 
     # --- Scheduler ---
     scheduler = MarketScheduler()
 
-    return SignalPilotApp(
+    app = SignalPilotApp(
         db=db,
         signal_repo=signal_repo,
         trade_repo=trade_repo,
@@ -129,6 +136,8 @@ async def create_app(config: AppConfig) -> SignalPilotApp:
         bot=bot,
         scheduler=scheduler,
     )
+    app_ref[0] = app  # complete the circular reference
+    return app
 
 
 async def main() -> None:
@@ -164,5 +173,15 @@ async def main() -> None:
         pass
 
 
+def _install_uvloop() -> None:
+    """Run on uvloop when it is installed; otherwise keep the stdlib event loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(main())
@@ -1,5 +1,7 @@
 """Signal ranking engine — scores, ranks, and selects top-N signals."""
 
+import heapq
+
 from signalpilot.db.models import CandidateSignal, RankedSignal
 from signalpilot.ranking.scorer import SignalScorer
 
@@ -13,25 +15,28 @@ class SignalRanker:
 
     def rank(self, candidates: list[CandidateSignal]) -> list[RankedSignal]:
         """Score all candidates, sort descending, assign stars, return top N."""
-        scored: list[tuple[CandidateSignal, float]] = []
-        for candidate in candidates:
-            score = self._scorer.score(candidate)
-            scored.append((candidate, score))
-
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        ranked: list[RankedSignal] = []
-        for i, (candidate, score) in enumerate(scored[: self._max_signals]):
-            stars = self._score_to_stars(score)
-            ranked.append(
-                RankedSignal(
-                    candidate=candidate,
-                    composite_score=score,
-                    rank=i + 1,
-                    signal_strength=stars,
-                )
+        if not candidates:
+            return []
+        scores = self._scorer.score_many(candidates)
+        indices = range(len(scores))
+        # Both paths order by score descending and keep input order on ties.
+        if len(scores) <= self._max_signals:
+            # Everything is selected; a plain sort is cheapest for small N.
+            top = sorted(indices, key=scores.__getitem__, reverse=True)
+        else:
+            # Select the top N indices on the score column (O(N log k)).
+            top = heapq.nlargest(self._max_signals, indices, key=scores.__getitem__)
+
+        to_stars = self._score_to_stars
+        return [
+            RankedSignal(
+                candidate=candidates[idx],
+                composite_score=scores[idx],
+                rank=rank,
+                signal_strength=to_stars(scores[idx]),
             )
-        return ranked
+            for rank, idx in enumerate(top, start=1)
+        ]
 
     @staticmethod
     def _score_to_stars(score: float) -> int:
@@ -40,12 +45,4 @@ class SignalRanker:
         [0.0, 0.2) → 1, [0.2, 0.4) → 2, [0.4, 0.6) → 3,
         [0.6, 0.8) → 4, [0.8, 1.0] → 5.
         """
-        if score >= 0.8:
-            return 5
-        if score >= 0.6:
-            return 4
-        if score >= 0.4:
-            return 3
-        if score >= 0.2:
-            return 2
-        return 1
+        return min(5, max(1, int(score * 5) + 1))
@@ -12,6 +12,10 @@ class SignalScorer:
 
     def __init__(self, weights: ScoringWeights) -> None:
         self._weights = weights
+        # Resolved once here so scoring reads plain instance attributes
+        self._gap_w = weights.gap_pct_weight
+        self._vol_w = weights.volume_ratio_weight
+        self._dist_w = weights.price_distance_weight
 
     def score(self, signal: CandidateSignal) -> float:
         """Compute a composite score in [0.0, 1.0] for a candidate signal.
@@ -24,11 +28,26 @@ class SignalScorer:
         norm_vol = self._normalize_volume_ratio(signal.volume_ratio)
         norm_dist = self._normalize_price_distance(signal.price_distance_from_open_pct)
 
-        return (
-            norm_gap * self._weights.gap_pct_weight
-            + norm_vol * self._weights.volume_ratio_weight
-            + norm_dist * self._weights.price_distance_weight
-        )
+        return norm_gap * self._gap_w + norm_vol * self._vol_w + norm_dist * self._dist_w
+
+    def score_many(self, signals: list[CandidateSignal]) -> list[float]:
+        """Compute composite scores for a batch of candidates in one pass.
+
+        Equivalent to ``[self.score(s) for s in signals]``, but the weights and
+        normalizers are resolved once per batch instead of once per candidate.
+        """
+        gap_w = self._gap_w
+        vol_w = self._vol_w
+        dist_w = self._dist_w
+        norm_gap = self._normalize_gap
+        norm_vol = self._normalize_volume_ratio
+        norm_dist = self._normalize_price_distance
+        return [
+            norm_gap(s.gap_pct) * gap_w
+            + norm_vol(s.volume_ratio) * vol_w
+            + norm_dist(s.price_distance_from_open_pct) * dist_w
+            for s in signals
+        ]
 
     @staticmethod
     def _normalize_gap(gap_pct: float) -> float:
@@ -20,11 +20,9 @@ class PositionSizer:
         Raises:
             ValueError: If max_positions <= 0 or entry_price <= 0.
         """
-        if max_positions <= 0:
-            raise ValueError(f"max_positions must be positive, got {max_positions}")
+        per_trade_capital = self.per_trade_capital(total_capital, max_positions)
         if entry_price <= 0:
             raise ValueError(f"entry_price must be positive, got {entry_price}")
-        per_trade_capital = total_capital / max_positions
         quantity = int(per_trade_capital // entry_price)
         capital_required = quantity * entry_price
         return PositionSize(
@@ -32,3 +30,14 @@ class PositionSizer:
             capital_required=capital_required,
             per_trade_capital=per_trade_capital,
         )
+
+    @staticmethod
+    def per_trade_capital(total_capital: float, max_positions: int) -> float:
+        """Return the capital allotted to each position (total_capital / max_positions).
+
+        Raises:
+            ValueError: If max_positions <= 0.
+        """
+        if max_positions <= 0:
+            raise ValueError(f"max_positions must be positive, got {max_positions}")
+        return total_capital / max_positions
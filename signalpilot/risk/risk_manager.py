@@ -8,6 +8,9 @@ from signalpilot.risk.position_sizer import PositionSizer
 
 logger = logging.getLogger(__name__)
 
+# Signals are valid for 30 minutes after generation.
+_EXPIRY_DELTA = timedelta(minutes=30)
+
 
 class RiskManager:
     """Applies risk filters to ranked signals before delivery."""
@@ -37,28 +40,33 @@ class RiskManager:
             )
             return []
 
+        # Capital per slot is constant for the whole batch, so derive it once
+        # and size each signal inline instead of going through calculate().
+        per_trade_capital = self._sizer.per_trade_capital(
+            user_config.total_capital, user_config.max_positions
+        )
         final_signals: list[FinalSignal] = []
         for ranked in ranked_signals[:available_slots]:
-            size = self._sizer.calculate(
-                entry_price=ranked.candidate.entry_price,
-                total_capital=user_config.total_capital,
-                max_positions=user_config.max_positions,
-            )
-            if size.quantity == 0:
+            candidate = ranked.candidate
+            entry_price = candidate.entry_price
+            if entry_price <= 0:
+                raise ValueError(f"entry_price must be positive, got {entry_price}")
+            quantity = int(per_trade_capital // entry_price)
+            if quantity == 0:
                 logger.info(
                     "Auto-skipped %s: price %.2f exceeds per-trade allocation %.2f",
-                    ranked.candidate.symbol,
-                    ranked.candidate.entry_price,
-                    size.per_trade_capital,
+                    candidate.symbol,
+                    entry_price,
+                    per_trade_capital,
                 )
                 continue
 
-            expires_at = ranked.candidate.generated_at + timedelta(minutes=30)
+            expires_at = candidate.generated_at + _EXPIRY_DELTA
             final_signals.append(
                 FinalSignal(
                     ranked_signal=ranked,
-                    quantity=size.quantity,
-                    capital_required=size.capital_required,
+                    quantity=quantity,
+                    capital_required=quantity * entry_price,
                     expires_at=expires_at,
                 )
             )
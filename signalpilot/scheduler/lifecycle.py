@@ -2,17 +2,41 @@
 
 import asyncio
 import logging
+import secrets
+import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 
-from signalpilot.db.models import FinalSignal, SignalRecord
+from signalpilot.db.models import FinalSignal, HistoricalReference, SignalRecord, TradeRecord
 from signalpilot.telegram.formatters import format_daily_summary
 from signalpilot.utils.constants import IST
-from signalpilot.utils.log_context import reset_context, set_context
+from signalpilot.utils.log_context import log_context, set_context, with_job_context
 from signalpilot.utils.market_calendar import StrategyPhase, get_current_phase
 
 logger = logging.getLogger(__name__)
 
+# Phases during which new signals may be generated
+_SIGNAL_PHASES = frozenset({StrategyPhase.OPENING, StrategyPhase.ENTRY_WINDOW})
+
+# Longest a single component may take to close before shutdown moves on
+_SHUTDOWN_STEP_TIMEOUT = 5.0
+
+
+@contextmanager
+def _timed(section: str, timings: dict[str, float] | None) -> Iterator[None]:
+    """Record the wall time of a block into *timings*; a no-op when it is None."""
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[section] = time.perf_counter() - start
+
 
 class SignalPilotApp:
     """Main application orchestrator. Owns all components and manages lifecycle."""
@@ -56,249 +80,424 @@ class SignalPilotApp:
         self._scanning = False
         self._accepting_signals = True
         self._scan_task: asyncio.Task | None = None
+        # Strong references to every scan task until it finishes; the event loop
+        # only keeps weak references, so a replaced _scan_task could be collected.
+        self._scan_tasks: set[asyncio.Task] = set()
+        # Circuit breaker: stop scanning after this many errors within _error_window
         self._max_consecutive_errors = 10
-        self._fetch_cooldown = 5  # seconds between prev-day and ADV fetch passes
+        self._error_window = 60.0
+        # Back off after consecutive errors, capped well below the window so a
+        # persistent failure still trips the breaker within _error_window
+        self._max_error_backoff = 5.0
+        # Log cycle ids: a per-process prefix keeps them unique across a crash-recovery
+        # restart that appends to the same day's log, then a scan iteration counter
+        self._cycle_prefix = secrets.token_hex(2)
+        self._cycle_seq = 0
+        self._scan_interval = 1.0  # heartbeat: longest gap between scan iterations
+        self._min_scan_interval = 0.25  # throttle: shortest gap, however fast ticks arrive
+        # Gap between iterations when no signal can fire and no trade needs exit checks;
+        # kept short because a trade taken via Telegram is only seen on the next cycle
+        self._idle_scan_interval = 5.0
+        self._tick_event = asyncio.Event()
+        # Readers compare expires_at themselves, so the status sweep can lag a little
+        self._expiry_interval = 30.0
+        self._next_expiry_at = 0.0
+        # Exit checks may send Telegram alerts; bound how many run at once
+        self._exit_check_semaphore = asyncio.Semaphore(8)
 
     async def startup(self) -> None:
-        """Full startup sequence."""
+        """Full startup sequence.
+
+        After the database is ready, three independent branches run concurrently:
+        auth -> instruments -> historical data, config initialisation, and bot start.
+        Jobs are scheduled only once all of them have finished.
+        """
         logger.info("Starting SignalPilot...")
         await self._db.initialize()
+        await asyncio.gather(
+            self._load_market_reference_data(),
+            self._initialize_config(),
+            self._start_bot(),
+        )
+        self._scheduler.configure_jobs(self)
+        self._scheduler.start()
+        logger.info("SignalPilot startup complete")
+
+    async def _authenticate_and_load_instruments(self) -> None:
+        """Authenticate with the broker, then load the instrument universe."""
         if self._authenticator:
             await self._authenticator.authenticate()
         if self._instruments:
             await self._instruments.load()
+
+    async def _load_market_reference_data(self) -> None:
+        """Authenticate, load instruments, then fetch and store historical reference data."""
+        await self._authenticate_and_load_instruments()
         if self._historical:
-            await self._historical.fetch_previous_day_data()
-            # Cooldown: let Angel One's per-minute rate window reset before ADV pass
-            reset_fn = getattr(self._historical, "reset_rate_limiter", None)
-            if self._fetch_cooldown > 0 and reset_fn and not asyncio.iscoroutinefunction(reset_fn):
-                logger.info("Cooling down %ds before ADV fetch...", self._fetch_cooldown)
-                reset_fn()
-                await asyncio.sleep(self._fetch_cooldown)
-            await self._historical.fetch_average_daily_volume()
+            # Both passes draw on the fetcher's shared rate limiter, which enforces
+            # the Angel One per-second and per-minute budgets across them.
+            prev_data, adv_data = await asyncio.gather(
+                self._historical.fetch_previous_day_data(),
+                self._historical.fetch_average_daily_volume(),
+            )
+            refs = {
+                symbol: HistoricalReference(
+                    previous_close=prev.close,
+                    previous_high=prev.high,
+                    average_daily_volume=adv,
+                )
+                for symbol, prev in prev_data.items()
+                if (adv := adv_data.get(symbol)) is not None
+            }
+            await self._market_data.set_historical_many(refs)
+            logger.info("Loaded historical references for %d instruments", len(refs))
+
+    async def _initialize_config(self) -> None:
+        """Create the default user config row if it does not exist yet."""
         if self._config_repo:
             await self._config_repo.initialize_default(
                 telegram_chat_id="",
             )
+
+    async def _start_bot(self) -> None:
+        """Start Telegram polling."""
         if self._bot:
             await self._bot.start()
-        self._scheduler.configure_jobs(self)
-        self._scheduler.start()
-        logger.info("SignalPilot startup complete")
 
+    @with_job_context("start_scanning")
     async def start_scanning(self) -> None:
         """Begin the continuous scanning loop (called at 9:15 AM)."""
-        set_context(job_name="start_scanning")
-        try:
-            if not self._websocket:
-                logger.warning("Skipping scan start: websocket component not configured")
-                return
-            logger.info("Starting market scanning")
-            await self._websocket.connect()
-            self._scanning = True
-            self._accepting_signals = True
-            self._scan_task = asyncio.create_task(self._scan_loop())
-        finally:
-            reset_context()
+        if not self._websocket:
+            logger.warning("Skipping scan start: websocket component not configured")
+            return
+        logger.info("Starting market scanning")
+        await self._websocket.connect()
+        self._scanning = True
+        self._accepting_signals = True
+        task = asyncio.create_task(
+            self._scan_loop(), name=f"scan-{uuid.uuid4().hex[:6]}"
+        )
+        self._scan_tasks.add(task)
+        task.add_done_callback(self._scan_tasks.discard)
+        self._scan_task = task
 
     async def _scan_loop(self) -> None:
-        """Main scanning loop. Runs every second while active."""
+        """Main scanning loop.
+
+        Iterations are driven by websocket ticks (see ``notify_tick``), throttled to
+        at most one per ``_min_scan_interval`` and run at least once per
+        ``_scan_interval`` even when no ticks arrive.
+        """
+        error_times: deque[float] = deque(maxlen=self._max_consecutive_errors)
         consecutive_errors = 0
         while self._scanning:
-            cycle_id = uuid.uuid4().hex[:8]
-            try:
-                now = datetime.now(IST)
-                phase = get_current_phase(now)
-                set_context(cycle_id=cycle_id, phase=phase.value)
-
-                if self._accepting_signals and phase in (
-                    StrategyPhase.OPENING,
-                    StrategyPhase.ENTRY_WINDOW,
-                ):
-                    candidates = await self._strategy.evaluate(self._market_data, phase)
-                    if candidates:
-                        ranked = self._ranker.rank(candidates)
-                        user_config = await self._config_repo.get_user_config()
-                        active_count = await self._trade_repo.get_active_trade_count()
-                        final_signals = self._risk_manager.filter_and_size(
-                            ranked,
-                            user_config,
-                            active_count,
-                        )
-                        for signal in final_signals:
-                            record = self._signal_to_record(signal, now)
-                            signal_id = await self._signal_repo.insert_signal(record)
-                            record.id = signal_id
-                            await self._bot.send_signal(signal)
-                            logger.info(
-                                "Signal sent for %s (id=%d)", record.symbol, signal_id
-                            )
+            tick_start = time.monotonic()
+            self._cycle_seq += 1
+            idle = False
+            cycle_id = f"{self._cycle_prefix}{self._cycle_seq:06x}"
+            # The phase token lets the per-cycle set_context(phase=...) be undone on exit
+            async with log_context(cycle_id=cycle_id, phase=None):
+                try:
+                    now = datetime.now(IST)
+                    phase = get_current_phase(now)
+                    set_context(phase=phase.value)
 
-                active_trades = await self._trade_repo.get_active_trades()
-                for trade in active_trades:
-                    await self._exit_monitor.check_trade(trade)
-                await self._expire_stale_signals()
-                consecutive_errors = 0
+                    # Per-step timings are only collected when DEBUG logging is on
+                    timings = {} if logger.isEnabledFor(logging.DEBUG) else None
 
-            except Exception:
-                consecutive_errors += 1
-                logger.exception(
-                    "Error in scan loop iteration (%d consecutive)", consecutive_errors
-                )
-                if consecutive_errors >= self._max_consecutive_errors:
-                    logger.critical(
-                        "Too many consecutive errors (%d), stopping scan loop",
-                        consecutive_errors,
+                    # One read serves both the position-limit check and exit monitoring
+                    with _timed("active_trades", timings):
+                        active_trades = await self._trade_repo.get_active_trades()
+
+                    signals_open = self._accepting_signals and phase in _SIGNAL_PHASES
+                    idle = not signals_open and not active_trades
+
+                    if signals_open:
+                        with _timed("evaluate", timings):
+                            candidates = await self._strategy.evaluate(self._market_data, phase)
+                        if candidates:
+                            with _timed("rank", timings):
+                                ranked = self._ranker.rank(candidates)
+                            user_config = await self._config_repo.get_user_config()
+                            with _timed("filter_and_size", timings):
+                                final_signals = self._risk_manager.filter_and_size(
+                                    ranked,
+                                    user_config,
+                                    len(active_trades),
+                                )
+                            if final_signals:
+                                with _timed("persist_and_send", timings):
+                                    await self._persist_and_send(final_signals, now)
+
+                    with _timed("check_exits", timings):
+                        await self._check_exits(active_trades)
+                    if tick_start >= self._next_expiry_at:
+                        with _timed("expire", timings):
+                            await self._expire_stale_signals(now)
+                        self._next_expiry_at = tick_start + self._expiry_interval
+                    consecutive_errors = 0
+
+                    if timings is not None:
+                        logger.debug(
+                            "Cycle timings: %s",
+                            ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in timings.items()),
+                        )
+
+                except Exception:
+                    consecutive_errors += 1
+                    error_at = time.monotonic()
+                    error_times.append(error_at)
+                    recent_errors = sum(1 for t in error_times if error_at - t < self._error_window)
+                    logger.exception(
+                        "Error in scan loop iteration (%d in the last %.0fs)",
+                        recent_errors,
+                        self._error_window,
                     )
-                    self._scanning = False
-                    try:
-                        await self._bot.send_alert(
-                            "ALERT: Scan loop stopped due to repeated errors. "
-                            "Manual intervention required."
+                    if recent_errors >= self._max_consecutive_errors:
+                        logger.critical(
+                            "Too many errors (%d in %.0fs), stopping scan loop",
+                            recent_errors,
+                            self._error_window,
                         )
-                    except Exception:
-                        logger.exception("Failed to send circuit-breaker alert")
-                    break
-            finally:
-                reset_context()
+                        self._scanning = False
+                        try:
+                            await self._bot.send_alert(
+                                "ALERT: Scan loop stopped due to repeated errors. "
+                                "Manual intervention required."
+                            )
+                        except Exception:
+                            logger.exception("Failed to send circuit-breaker alert")
+                        break
+
+            elapsed = time.monotonic() - tick_start
+            if elapsed > self._scan_interval:
+                logger.warning(
+                    "Scan iteration took %.2fs (interval %.1fs); scan is falling behind",
+                    elapsed,
+                    self._scan_interval,
+                )
+            if consecutive_errors:
+                backoff = 0.5 * 2 ** min(consecutive_errors - 1, 6)
+                await asyncio.sleep(min(self._max_error_backoff, backoff))
+                continue
+            if idle:
+                # Nothing reacts to ticks right now; skip them until the idle interval
+                await asyncio.sleep(max(0.0, self._idle_scan_interval - elapsed))
+                continue
+            # Throttle first, then wait for fresh ticks until the heartbeat is due.
+            await asyncio.sleep(max(0.0, self._min_scan_interval - elapsed))
+            if self._scanning:
+                await self._wait_for_tick(tick_start + self._scan_interval)
 
-            await asyncio.sleep(1)
+    def notify_tick(self) -> None:
+        """Wake the scan loop because new market data has arrived."""
+        self._tick_event.set()
 
+    async def _wait_for_tick(self, deadline: float) -> None:
+        """Wait until a tick is notified or the monotonic *deadline* passes."""
+        remaining = deadline - time.monotonic()
+        if remaining > 0 and not self._tick_event.is_set():
+            try:
+                await asyncio.wait_for(self._tick_event.wait(), timeout=remaining)
+            except TimeoutError:
+                pass
+        self._tick_event.clear()
+
+    @with_job_context("stop_new_signals")
     async def stop_new_signals(self) -> None:
         """Stop generating new signals (called at 2:30 PM)."""
-        set_context(job_name="stop_new_signals")
-        try:
-            self._accepting_signals = False
-            if self._bot:
-                await self._bot.send_alert(
-                    "No new signals after 2:30 PM. Monitoring existing positions only."
-                )
-            logger.info("Signal generation stopped")
-        finally:
-            reset_context()
+        self._accepting_signals = False
+        if self._bot:
+            await self._bot.send_alert(
+                "No new signals after 2:30 PM. Monitoring existing positions only."
+            )
+        logger.info("Signal generation stopped")
 
+    @with_job_context("send_pre_market_alert")
     async def send_pre_market_alert(self) -> None:
         """Send pre-market alert (called at 9:00 AM)."""
-        set_context(job_name="send_pre_market_alert")
-        try:
-            if self._bot:
-                await self._bot.send_alert(
-                    "Pre-market scan running. Signals coming shortly after 9:15 AM."
-                )
-            logger.info("Pre-market alert sent")
-        finally:
-            reset_context()
+        if self._bot:
+            await self._bot.send_alert(
+                "Pre-market scan running. Signals coming shortly after 9:15 AM."
+            )
+        logger.info("Pre-market alert sent")
 
+    @with_job_context("trigger_exit_reminder")
     async def trigger_exit_reminder(self) -> None:
         """Send exit reminder (called at 3:00 PM)."""
-        set_context(job_name="trigger_exit_reminder")
-        try:
-            active_trades = await self._trade_repo.get_active_trades()
-            await self._exit_monitor.trigger_time_exit(active_trades, is_mandatory=False)
-            if self._bot:
-                await self._bot.send_alert(
-                    "Market closing soon. Close all intraday positions in the next 15 minutes."
-                )
-            logger.info("Exit reminder sent")
-        finally:
-            reset_context()
+        active_trades = await self._trade_repo.get_active_trades()
+        await self._exit_monitor.trigger_time_exit(active_trades, is_mandatory=False)
+        if self._bot:
+            await self._bot.send_alert(
+                "Market closing soon. Close all intraday positions in the next 15 minutes."
+            )
+        logger.info("Exit reminder sent")
 
+    @with_job_context("trigger_mandatory_exit")
     async def trigger_mandatory_exit(self) -> None:
         """Trigger mandatory exit (called at 3:15 PM)."""
-        set_context(job_name="trigger_mandatory_exit")
-        try:
-            active_trades = await self._trade_repo.get_active_trades()
-            await self._exit_monitor.trigger_time_exit(active_trades, is_mandatory=True)
-            logger.info("Mandatory exit triggered")
-        finally:
-            reset_context()
+        active_trades = await self._trade_repo.get_active_trades()
+        await self._exit_monitor.trigger_time_exit(active_trades, is_mandatory=True)
+        logger.info("Mandatory exit triggered")
 
+    @with_job_context("send_daily_summary")
     async def send_daily_summary(self) -> None:
         """Generate and send daily summary (called at 3:30 PM)."""
-        set_context(job_name="send_daily_summary")
-        try:
-            if not self._metrics or not self._bot:
-                logger.warning("Skipping daily summary: missing metrics or bot component")
-                return
-            today = datetime.now(IST).date()
-            summary = await self._metrics.calculate_daily_summary(today)
-            message = format_daily_summary(summary)
-            await self._bot.send_alert(message)
-            logger.info("Daily summary sent")
-        finally:
-            reset_context()
+        if not self._metrics or not self._bot:
+            logger.warning("Skipping daily summary: missing metrics or bot component")
+            return
+        today = datetime.now(IST).date()
+        summary = await self._metrics.calculate_daily_summary(today)
+        message = format_daily_summary(summary)
+        await self._bot.send_alert(message)
+        logger.info("Daily summary sent")
 
+    @with_job_context("shutdown")
     async def shutdown(self) -> None:
         """Graceful shutdown sequence."""
-        set_context(job_name="shutdown")
-        try:
-            logger.info("Shutting down SignalPilot...")
-            self._scanning = False
-            if self._scan_task and not self._scan_task.done():
-                self._scan_task.cancel()
-                try:
-                    await self._scan_task
-                except asyncio.CancelledError:
-                    pass
-
-            cleanup = [("db", self._db.close())]
-            if self._websocket:
-                cleanup.insert(0, ("websocket", self._websocket.disconnect()))
-            if self._bot:
-                cleanup.insert(-1, ("bot", self._bot.stop()))
-            for name, coro in cleanup:
-                try:
-                    await coro
-                except Exception:
-                    logger.exception("Error shutting down %s", name)
+        logger.info("Shutting down SignalPilot...")
+        self._scanning = False
+        scan_tasks = set(self._scan_tasks)
+        if self._scan_task:
+            scan_tasks.add(self._scan_task)
+        pending = [task for task in scan_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
-            self._scheduler.shutdown()
-            logger.info("SignalPilot shutdown complete")
-        finally:
-            reset_context()
+        # The websocket and bot close independently; the database closes last
+        # so in-flight bot handlers can finish their queries.
+        await self._close_components(
+            [
+                ("websocket", self._websocket.disconnect() if self._websocket else None),
+                ("bot", self._bot.stop() if self._bot else None),
+            ]
+        )
+        await self._close_components([("db", self._db.close())])
+
+        self._scheduler.shutdown()
+        logger.info("SignalPilot shutdown complete")
 
+    @with_job_context("recover")
     async def recover(self) -> None:
         """Crash recovery: re-auth, reconnect, reload today's state."""
-        set_context(job_name="recover")
-        try:
-            logger.info("Starting crash recovery...")
-            await self._db.initialize()
-            if self._authenticator:
-                await self._authenticator.authenticate()
-            if self._instruments:
-                await self._instruments.load()
-            if self._trade_repo and self._exit_monitor:
-                active_trades = await self._trade_repo.get_active_trades()
-                for trade in active_trades:
-                    self._exit_monitor.start_monitoring(trade)
-            else:
-                active_trades = []
-            if self._bot:
-                await self._bot.start()
-                await self._bot.send_alert(
-                    "System recovered from interruption. Monitoring resumed."
+        logger.info("Starting crash recovery...")
+        await self._db.initialize()
+        _, active_trades, _ = await asyncio.gather(
+            self._authenticate_and_load_instruments(),
+            self._restore_active_trades(),
+            self._start_bot_after_recovery(),
+        )
+        self._scheduler.configure_jobs(self)
+        self._scheduler.start()
+        if self._websocket:
+            await self.start_scanning()
+
+        # Respect signal cutoff if recovering after entry window
+        now = datetime.now(IST)
+        phase = get_current_phase(now)
+        if phase not in _SIGNAL_PHASES:
+            self._accepting_signals = False
+            logger.info("Recovery after entry window; new signals disabled")
+
+        logger.info(
+            "Crash recovery complete, %d active trades restored", len(active_trades)
+        )
+
+    @staticmethod
+    async def _close_components(
+        steps: list[tuple[str, Awaitable[None] | None]],
+        timeout: float = _SHUTDOWN_STEP_TIMEOUT,
+    ) -> None:
+        """Await cleanup coroutines concurrently, logging each failure by component.
+
+        Each step is bounded by *timeout* so one hung component cannot stall shutdown.
+        """
+        steps = [(name, coro) for name, coro in steps if coro is not None]
+        results = await asyncio.gather(
+            *(asyncio.wait_for(coro, timeout) for _, coro in steps),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(steps, results):
+            if isinstance(result, TimeoutError):
+                logger.error("Timed out shutting down %s after %.0fs", name, timeout)
+            elif isinstance(result, Exception):
+                logger.error("Error shutting down %s", name, exc_info=result)
+
+    async def _persist_and_send(self, signals: list[FinalSignal], now: datetime) -> None:
+        """Store signals and deliver them to Telegram, overlapping the two round-trips.
+
+        Delivery does not depend on the row IDs, so the bulk insert and the batched
+        send run concurrently. A send failure is logged; an insert failure is raised
+        so the scan loop counts it as an iteration error.
+        """
+        records = [self._signal_to_record(signal, now) for signal in signals]
+        signal_ids, send_result = await asyncio.gather(
+            self._signal_repo.insert_signals(records),
+            self._bot.send_signals(signals),
+            return_exceptions=True,
+        )
+        if isinstance(send_result, Exception):
+            logger.error(
+                "Failed to send %d signal(s): %s",
+                len(records),
+                ", ".join(record.symbol for record in records),
+                exc_info=send_result,
+            )
+        if isinstance(signal_ids, Exception):
+            raise signal_ids
+        for record, signal_id in zip(records, signal_ids):
+            record.id = signal_id
+            if not isinstance(send_result, Exception):
+                logger.info("Signal sent for %s (id=%d)", record.symbol, signal_id)
+
+    async def _check_exits(self, trades: list[TradeRecord]) -> None:
+        """Run exit checks for all open trades concurrently, bounded by a semaphore.
+
+        A failing check is logged and does not prevent the other trades from being checked.
+        """
+        if not trades:
+            return
+
+        async def check(trade: TradeRecord):
+            async with self._exit_check_semaphore:
+                return await self._exit_monitor.check_trade(trade)
+
+        results = await asyncio.gather(*(check(t) for t in trades), return_exceptions=True)
+        for trade, result in zip(trades, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Exit check failed for trade %s (%s)",
+                    trade.id,
+                    trade.symbol,
+                    exc_info=result,
                 )
-            self._scheduler.configure_jobs(self)
-            self._scheduler.start()
-            if self._websocket:
-                await self.start_scanning()
 
-            # Respect signal cutoff if recovering after entry window
-            now = datetime.now(IST)
-            phase = get_current_phase(now)
-            if phase not in (StrategyPhase.OPENING, StrategyPhase.ENTRY_WINDOW):
-                self._accepting_signals = False
-                logger.info("Recovery after entry window; new signals disabled")
+    async def _restore_active_trades(self) -> list[TradeRecord]:
+        """Resume exit monitoring for today's open trades and return them."""
+        if not (self._trade_repo and self._exit_monitor):
+            return []
+        active_trades = await self._trade_repo.get_active_trades()
+        for trade in active_trades:
+            self._exit_monitor.start_monitoring(trade)
+        return active_trades
 
-            logger.info(
-                "Crash recovery complete, %d active trades restored", len(active_trades)
+    async def _start_bot_after_recovery(self) -> None:
+        """Restart Telegram polling and tell the user monitoring has resumed."""
+        if self._bot:
+            await self._bot.start()
+            await self._bot.send_alert(
+                "System recovered from interruption. Monitoring resumed."
             )
-        finally:
-            reset_context()
 
-    async def _expire_stale_signals(self) -> None:
-        """Expire signals past their expiry time."""
-        now = datetime.now(IST)
+    async def _expire_stale_signals(self, now: datetime | None = None) -> None:
+        """Expire signals past their expiry time.
+
+        The scan loop passes its per-iteration ``now`` so the clock is read once per tick.
+        """
+        if now is None:
+            now = datetime.now(IST)
         count = await self._signal_repo.expire_stale_signals(now)
         if count > 0:
             logger.info("Expired %d stale signals", count)
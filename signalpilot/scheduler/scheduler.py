@@ -9,6 +9,20 @@ from signalpilot.utils.constants import IST
 
 logger = logging.getLogger(__name__)
 
+# (job id, hour, minute, SignalPilotApp method name); triggers are built once at import.
+_JOB_SPECS = tuple(
+    (job_id, hour, minute, CronTrigger(hour=hour, minute=minute, timezone=IST), method)
+    for job_id, hour, minute, method in (
+        ("pre_market_alert", 9, 0, "send_pre_market_alert"),
+        ("start_scanning", 9, 15, "start_scanning"),
+        ("stop_new_signals", 14, 30, "stop_new_signals"),
+        ("exit_reminder", 15, 0, "trigger_exit_reminder"),
+        ("mandatory_exit", 15, 15, "trigger_mandatory_exit"),
+        ("daily_summary", 15, 30, "send_daily_summary"),
+        ("shutdown", 15, 35, "shutdown"),
+    )
+)
+
 
 class MarketScheduler:
     """Manages scheduled events for the trading day using APScheduler."""
@@ -28,19 +42,10 @@ class MarketScheduler:
         - send_daily_summary()
         - shutdown()
         """
-        jobs = [
-            ("pre_market_alert", 9, 0, app.send_pre_market_alert),
-            ("start_scanning", 9, 15, app.start_scanning),
-            ("stop_new_signals", 14, 30, app.stop_new_signals),
-            ("exit_reminder", 15, 0, app.trigger_exit_reminder),
-            ("mandatory_exit", 15, 15, app.trigger_mandatory_exit),
-            ("daily_summary", 15, 30, app.send_daily_summary),
-            ("shutdown", 15, 35, app.shutdown),
-        ]
-        for job_id, hour, minute, callback in jobs:
+        for job_id, hour, minute, trigger, method in _JOB_SPECS:
             self._scheduler.add_job(
-                callback,
-                CronTrigger(hour=hour, minute=minute, timezone=IST),
+                getattr(app, method),
+                trigger,
                 id=job_id,
                 replace_existing=True,
             )
@@ -1,10 +1,13 @@
 """SignalPilot Telegram bot — signal delivery and command handling."""
 
+import asyncio
 import logging
+import re
 import time
 
 from telegram import Update
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     ApplicationBuilder,
     ContextTypes,
@@ -21,10 +24,22 @@ from signalpilot.telegram.handlers import (
     handle_status,
     handle_taken,
 )
+from signalpilot.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from signalpilot.utils.log_context import log_context
 
 logger = logging.getLogger(__name__)
 
+# Telegram rejects messages longer than this many characters.
+_MAX_MESSAGE_LENGTH = 4096
+_SIGNAL_SEPARATOR = "\n\n"
+# Every text command the bot accepts; the matched word selects the handler.
+_COMMAND_PATTERN = re.compile(
+    r"^(?:(?P<command>taken|status|journal|help)|(?P<capital>capital)\s+\d+(?:\.\d+)?)$",
+    re.IGNORECASE,
+)
+# Exit alerts queued within this many seconds of each other share one message.
+_EXIT_ALERT_BATCH_WINDOW = 0.25
+
 
 class SignalPilotBot:
     """Main Telegram bot manager.
@@ -46,7 +61,8 @@ class SignalPilotBot:
         get_current_prices,
     ) -> None:
         self._bot_token = bot_token
-        self._chat_id = chat_id
+        # Parsed once; both the chat filter and send_message take the int directly
+        self._chat_id = int(chat_id)
         self._signal_repo = signal_repo
         self._trade_repo = trade_repo
         self._config_repo = config_repo
@@ -54,52 +70,57 @@ class SignalPilotBot:
         self._exit_monitor = exit_monitor
         self._get_current_prices = get_current_prices
         self._application: Application | None = None
+        # Fail fast while Telegram is down instead of stalling the scan loop
+        self._send_breaker = CircuitBreaker("telegram", failure_threshold=5, reset_timeout=30.0)
+        # Exit alerts are coalesced by a flusher task while the bot is running
+        self._exit_alerts: asyncio.Queue[str] = asyncio.Queue()
+        self._exit_alert_task: asyncio.Task | None = None
+        self._commands = {
+            "taken": self._handle_taken,
+            "status": self._handle_status,
+            "journal": self._handle_journal,
+            "capital": self._handle_capital,
+            "help": self._handle_help,
+        }
 
     async def start(self) -> None:
         """Initialize the bot, register handlers, and start polling."""
-        self._application = ApplicationBuilder().token(self._bot_token).build()
+        # Pace outbound calls within Telegram's flood limits and retry on RetryAfter
+        # instead of surfacing 429s to the scan loop.
+        self._application = (
+            ApplicationBuilder()
+            .token(self._bot_token)
+            .rate_limiter(AIORateLimiter(max_retries=3))
+            .build()
+        )
 
         # Restrict all commands to the configured chat ID
-        chat_filter = filters.Chat(chat_id=int(self._chat_id))
+        chat_filter = filters.Chat(chat_id=self._chat_id)
 
+        # One handler matches every command with a single regex, then dispatches
         self._application.add_handler(
             MessageHandler(
-                chat_filter & filters.TEXT & filters.Regex(r"(?i)^taken$"),
-                self._handle_taken,
-            )
-        )
-        self._application.add_handler(
-            MessageHandler(
-                chat_filter & filters.TEXT & filters.Regex(r"(?i)^status$"),
-                self._handle_status,
-            )
-        )
-        self._application.add_handler(
-            MessageHandler(
-                chat_filter & filters.TEXT & filters.Regex(r"(?i)^journal$"),
-                self._handle_journal,
-            )
-        )
-        self._application.add_handler(
-            MessageHandler(
-                chat_filter & filters.TEXT & filters.Regex(r"(?i)^capital\s+\d+(?:\.\d+)?$"),
-                self._handle_capital,
-            )
-        )
-        self._application.add_handler(
-            MessageHandler(
-                chat_filter & filters.TEXT & filters.Regex(r"(?i)^help$"),
-                self._handle_help,
+                chat_filter & filters.TEXT & filters.Regex(_COMMAND_PATTERN),
+                self._route_command,
             )
         )
 
         await self._application.initialize()
         await self._application.start()
         await self._application.updater.start_polling()
+        self._exit_alert_task = asyncio.create_task(
+            self._flush_exit_alerts(), name="exit-alert-flusher"
+        )
         logger.info("Telegram bot started polling")
 
     async def stop(self) -> None:
-        """Gracefully stop the bot."""
+        """Gracefully stop the bot, delivering any queued exit alerts first."""
+        flusher = self._exit_alert_task
+        if flusher is not None:
+            self._exit_alert_task = None  # later exit alerts are sent directly
+            await self._exit_alerts.join()
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
         if self._application:
             await self._application.updater.stop()
             await self._application.stop()
@@ -108,12 +129,42 @@ class SignalPilotBot:
 
     async def send_signal(self, signal: FinalSignal) -> None:
         """Format and send a signal message to the user's chat."""
-        message = format_signal_message(signal)
-        await self._application.bot.send_message(
-            chat_id=self._chat_id,
-            text=message,
-            parse_mode="HTML",
-        )
+        await self._send_message(format_signal_message(signal))
+        self._check_latency(signal)
+
+    async def send_signals(self, signals: list[FinalSignal]) -> None:
+        """Send several signals, packing them into as few messages as Telegram allows.
+
+        Formatted signals are joined with a blank line and split only where the
+        combined text would exceed Telegram's message length limit.
+        """
+        for text in self._pack_messages([format_signal_message(s) for s in signals]):
+            await self.send_alert(text)
+        for signal in signals:
+            self._check_latency(signal)
+
+    @staticmethod
+    def _pack_messages(messages: list[str]) -> list[str]:
+        """Join messages with a blank line, starting a new one at Telegram's length limit."""
+        packed: list[str] = []
+        batch: list[str] = []
+        length = 0
+        for message in messages:
+            added = len(message) + (len(_SIGNAL_SEPARATOR) if batch else 0)
+            if batch and length + added > _MAX_MESSAGE_LENGTH:
+                packed.append(_SIGNAL_SEPARATOR.join(batch))
+                batch = []
+                added = len(message)
+                length = 0
+            batch.append(message)
+            length += added
+        if batch:
+            packed.append(_SIGNAL_SEPARATOR.join(batch))
+        return packed
+
+    @staticmethod
+    def _check_latency(signal: FinalSignal) -> None:
+        """Warn when a signal reached the user more than 30s after generation."""
         latency = time.time() - signal.ranked_signal.candidate.generated_at.timestamp()
         if latency > 30:
             logger.warning(
@@ -124,19 +175,67 @@ class SignalPilotBot:
 
     async def send_alert(self, text: str) -> None:
         """Send a plain text alert message."""
-        await self._application.bot.send_message(
-            chat_id=self._chat_id,
-            text=text,
-            parse_mode="HTML",
-        )
+        await self._send_message(text)
+
+    async def _send_message(self, text: str) -> None:
+        """Send an HTML message to the user's chat through the circuit breaker.
+
+        Raises:
+            CircuitOpenError: If recent sends kept failing and the circuit is open.
+        """
+        if not self._send_breaker.allow():
+            raise CircuitOpenError("Telegram sends are suspended after repeated failures")
+        try:
+            await self._application.bot.send_message(
+                chat_id=self._chat_id,
+                text=text,
+                parse_mode="HTML",
+            )
+        except Exception:
+            self._send_breaker.record_failure()
+            raise
+        self._send_breaker.record_success()
 
     async def send_exit_alert(self, alert: ExitAlert) -> None:
-        """Format and send an exit alert."""
+        """Format and deliver an exit alert.
+
+        While the bot is running the alert is queued, and alerts raised within
+        ``_EXIT_ALERT_BATCH_WINDOW`` of each other (e.g. the 3:15 PM mandatory exit
+        across all trades) go out together. Otherwise it is sent immediately.
+        """
         message = format_exit_alert(alert)
-        await self.send_alert(message)
+        if self._exit_alert_task is None:
+            await self.send_alert(message)
+            return
+        self._exit_alerts.put_nowait(message)
+
+    async def _flush_exit_alerts(self) -> None:
+        """Background task: send queued exit alerts in coalesced batches."""
+        while True:
+            messages = [await self._exit_alerts.get()]
+            await asyncio.sleep(_EXIT_ALERT_BATCH_WINDOW)
+            while not self._exit_alerts.empty():
+                messages.append(self._exit_alerts.get_nowait())
+            try:
+                for text in self._pack_messages(messages):
+                    try:
+                        await self.send_alert(text)
+                    except Exception:
+                        logger.exception("Failed to send exit alert batch")
+            finally:
+                for _ in messages:
+                    self._exit_alerts.task_done()
 
     # -- Internal handler wrappers that bridge telegram Update to handler logic
 
+    async def _route_command(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Dispatch a message matched by ``_COMMAND_PATTERN`` to its command handler."""
+        match = context.matches[0]
+        command = (match["command"] or match["capital"]).lower()
+        await self._commands[command](update, context)
+
     async def _handle_taken(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -0,0 +1,66 @@
+"""Circuit breaker that short-circuits calls to a failing dependency."""
+
+import logging
+import time
+
+logger = logging.getLogger("signalpilot.utils.circuit_breaker")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker driven by consecutive failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    :meth:`allow` returns False for ``reset_timeout`` seconds.  The first call
+    allowed after that is a half-open probe: success closes the circuit again,
+    failure re-opens it for another ``reset_timeout``.
+
+    Args:
+        name: Dependency name used in log messages.
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds to stay open before allowing a probe.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return ``"closed"``, ``"open"`` or ``"half_open"``."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now."""
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._opened_at is not None:
+            logger.info("Circuit for %s closed", self._name)
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "Circuit for %s open for %.0fs after %d consecutive failures",
+                self._name,
+                self._reset_timeout,
+                self._failures,
+            )
@@ -6,9 +6,14 @@ that are automatically injected into log records by SignalPilotFormatter.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from contextvars import ContextVar, Token
+from typing import ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
 
 _cycle_id: ContextVar[str | None] = ContextVar("cycle_id", default=None)
 _phase: ContextVar[str | None] = ContextVar("phase", default=None)
@@ -79,3 +84,23 @@ async def log_context(**kwargs: str | None) -> AsyncIterator[None]:
     finally:
         for var, token in tokens:
             var.reset(token)
+
+
+def with_job_context(
+    job_name: str,
+) -> Callable[[Callable[_P, Awaitable[_R]]], Callable[_P, Awaitable[_R]]]:
+    """Decorator that runs an async function inside ``log_context(job_name=...)``.
+
+    The previous job_name is restored when the function returns, so a job that
+    calls another decorated job keeps its own name afterwards.
+    """
+
+    def decorator(fn: Callable[_P, Awaitable[_R]]) -> Callable[_P, Awaitable[_R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            async with log_context(job_name=job_name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -99,6 +99,21 @@ async def test_set_and_get_historical(store: MarketDataStore) -> None:
     assert result.previous_close == 95.0
 
 
+@pytest.mark.asyncio
+async def test_set_historical_many(store: MarketDataStore) -> None:
+    await store.set_historical("SBIN", _make_historical(prev_close=90.0))
+    await store.set_historical_many(
+        {
+            "SBIN": _make_historical(prev_close=95.0),
+            "TCS": _make_historical(prev_close=3500.0),
+        }
+    )
+    sbin = await store.get_historical("SBIN")
+    tcs = await store.get_historical("TCS")
+    assert sbin is not None and sbin.previous_close == 95.0
+    assert tcs is not None and tcs.previous_close == 3500.0
+
+
 @pytest.mark.asyncio
 async def test_get_historical_returns_none_for_unknown(store: MarketDataStore) -> None:
     result = await store.get_historical("UNKNOWN")
@@ -121,6 +121,31 @@ async def test_on_data_updates_store(
     assert tick.volume == 75000
 
 
+@pytest.mark.asyncio
+async def test_on_data_notifies_tick_listener(
+    mock_auth: MagicMock,
+    mock_instruments: MagicMock,
+    store: MarketDataStore,
+    mock_disconnect_alert: AsyncMock,
+) -> None:
+    """on_tick should fire after the store has been updated."""
+    on_tick = MagicMock()
+    client = WebSocketClient(
+        authenticator=mock_auth,
+        instruments=mock_instruments,
+        market_data_store=store,
+        on_disconnect_alert=mock_disconnect_alert,
+        on_tick=on_tick,
+    )
+    client._loop = asyncio.get_running_loop()
+
+    client._on_data(None, {"token": "3045", "last_traded_price": 10500})
+    await asyncio.sleep(0.1)
+
+    on_tick.assert_called_once()
+    assert await store.get_tick("SBIN") is not None
+
+
 @pytest.mark.asyncio
 async def test_on_data_ignores_unknown_token(
     client: WebSocketClient,
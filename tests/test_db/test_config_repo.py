@@ -2,6 +2,8 @@
 
 import pytest
 
+from signalpilot.db.config_repo import ConfigRepository
+
 
 class TestConfigRepository:
     async def test_get_returns_none_when_empty(self, config_repo):
@@ -70,3 +72,22 @@ class TestConfigRepository:
     async def test_update_max_positions_without_config_raises(self, config_repo):
         with pytest.raises(RuntimeError, match="No user config exists"):
             await config_repo.update_max_positions(3)
+
+    async def test_cached_config_reused_within_ttl(self, db_manager):
+        repo = ConfigRepository(db_manager.connection, cache_ttl=60.0)
+        await repo.initialize_default("12345")
+        first = await repo.get_user_config()
+
+        # A write that bypasses the repository is not seen until the TTL lapses
+        await db_manager.connection.execute("UPDATE user_config SET total_capital = 1.0")
+        await db_manager.connection.commit()
+        assert await repo.get_user_config() is first
+
+    async def test_update_invalidates_cached_config(self, db_manager):
+        repo = ConfigRepository(db_manager.connection, cache_ttl=60.0)
+        await repo.initialize_default("12345")
+        await repo.get_user_config()
+
+        await repo.update_capital(75000.0)
+        config = await repo.get_user_config()
+        assert config.total_capital == 75000.0
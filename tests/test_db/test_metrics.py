@@ -173,6 +173,7 @@ class TestMetricsCalculator:
 
         result = await metrics.calculate_performance_metrics(date_start=d2, date_end=d2)
         assert result.trades_taken == 1
+        assert result.total_signals == 1
         assert result.total_pnl == pytest.approx(-500.0)
         assert result.date_range_start == d2
         assert result.date_range_end == d2
@@ -1,5 +1,6 @@
 """Tests for core data models."""
 
+import dataclasses
 from datetime import date, datetime
 
 import pytest
@@ -282,6 +283,37 @@ class TestFinalSignal:
         assert final.capital_required == 10010.0
         assert final.expires_at == expires
 
+    def test_is_frozen(self):
+        candidate = CandidateSignal(
+            symbol="SBIN",
+            direction=SignalDirection.BUY,
+            strategy_name="gap_and_go",
+            entry_price=770.0,
+            stop_loss=745.0,
+            target_1=808.5,
+            target_2=823.9,
+            gap_pct=4.05,
+            volume_ratio=1.8,
+            price_distance_from_open_pct=1.2,
+            reason="Gap up",
+            generated_at=datetime(2026, 2, 16, 9, 35, 0),
+        )
+        ranked = RankedSignal(
+            candidate=candidate, composite_score=0.85, rank=1, signal_strength=4
+        )
+        final = FinalSignal(
+            ranked_signal=ranked,
+            quantity=13,
+            capital_required=10010.0,
+            expires_at=datetime(2026, 2, 16, 10, 5, 0),
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            final.quantity = 0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ranked.rank = 2
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            candidate.entry_price = 0.0
+
 
 class TestSignalRecord:
     def test_defaults(self):
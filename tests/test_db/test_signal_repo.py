@@ -52,6 +52,18 @@ class TestSignalRepository:
         assert signals[0].symbol == "SBIN"
         assert signals[0].entry_price == 770.0
 
+    async def test_insert_signals_returns_ids_in_order(self, signal_repo):
+        signals = [_make_signal(symbol="SBIN"), _make_signal(symbol="TCS")]
+        signal_ids = await signal_repo.insert_signals(signals)
+        assert len(signal_ids) == 2
+        assert signal_ids[0] < signal_ids[1]
+
+        stored = {s.id: s.symbol for s in await signal_repo.get_signals_by_date(date(2026, 2, 16))}
+        assert stored == {signal_ids[0]: "SBIN", signal_ids[1]: "TCS"}
+
+    async def test_insert_signals_empty(self, signal_repo):
+        assert await signal_repo.insert_signals([]) == []
+
     async def test_update_status(self, signal_repo):
         signal = _make_signal()
         signal_id = await signal_repo.insert_signal(signal)
@@ -19,7 +19,7 @@ from tests.test_integration.conftest import make_final_signal, make_signal_recor
 
 async def test_valid_signal_stored_and_sent(db, repos):
     """Mock strategy returns candidates, ranker ranks them, risk_manager sizes
-    them. Run one scan loop iteration. Verify signal is in DB and bot.send_signal
+    them. Run one scan loop iteration. Verify signal is in DB and bot.send_signals
     was called."""
     now = datetime.now(IST)
     signal = make_final_signal(generated_at=now)
@@ -74,7 +74,7 @@ async def test_valid_signal_stored_and_sent(db, repos):
     assert signals[0].status == "sent"
 
     # Verify bot was called
-    mock_bot.send_signal.assert_awaited_once_with(signal)
+    mock_bot.send_signals.assert_awaited_once_with([signal])
 
 
 async def test_no_candidates_no_signal(db, repos):
@@ -173,8 +173,9 @@ async def test_multiple_signals_all_stored(db, repos):
     symbols = {s.symbol for s in signals}
     assert symbols == {"SBIN", "TCS", "RELIANCE"}
 
-    # Bot called 3 times
-    assert mock_bot.send_signal.await_count == 3
+    # All 3 signals delivered in one batched send
+    mock_bot.send_signals.assert_awaited_once()
+    assert len(mock_bot.send_signals.call_args.args[0]) == 3
 
 
 async def test_signal_not_generated_during_continuous(db, repos):
@@ -94,6 +94,19 @@ def test_top_5_cutoff(ranker: SignalRanker) -> None:
     assert [r.rank for r in ranked] == [1, 2, 3, 4, 5]
 
 
+def test_top_n_selected_from_large_pool(ranker: SignalRanker) -> None:
+    """The top 5 of a larger pool should be the 5 highest scores, in order."""
+    candidates = [
+        _make_candidate(f"S{i:02d}", gap_pct=3.0 + (i % 7) * 0.3, volume_ratio=1.0)
+        for i in range(40)
+    ]
+
+    ranked = ranker.rank(candidates)
+
+    expected = sorted(candidates, key=ranker._scorer.score, reverse=True)[:5]
+    assert [r.candidate.symbol for r in ranked] == [c.symbol for c in expected]
+
+
 def test_custom_max_signals(scorer: SignalScorer) -> None:
     """Custom max_signals should limit output."""
     ranker = SignalRanker(scorer, max_signals=2)
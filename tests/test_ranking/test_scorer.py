@@ -155,3 +155,23 @@ def test_score_gap_dominant() -> None:
     candidate = _make_candidate(gap_pct=5.0, volume_ratio=0.5, price_distance_pct=0.0)
     # gap=1.0*0.40 + vol=0.0*0.35 + dist=0.0*0.25 = 0.40
     assert scorer.score(candidate) == pytest.approx(0.40)
+
+
+# ── Batch scoring ────────────────────────────────────────────────
+
+
+def test_score_many_matches_score(scorer: SignalScorer) -> None:
+    """Batch scores must be identical to per-candidate scores, in input order."""
+    candidates = [
+        _make_candidate(
+            gap_pct=3.0 + i * 0.37,
+            volume_ratio=0.2 + i * 0.41,
+            price_distance_pct=i * 0.45 - 0.5,
+        )
+        for i in range(10)
+    ]
+    assert scorer.score_many(candidates) == [scorer.score(c) for c in candidates]
+
+
+def test_score_many_empty(scorer: SignalScorer) -> None:
+    assert scorer.score_many([]) == []
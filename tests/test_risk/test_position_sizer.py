@@ -108,3 +108,12 @@ def test_zero_entry_price_raises(sizer: PositionSizer) -> None:
 def test_negative_entry_price_raises(sizer: PositionSizer) -> None:
     with pytest.raises(ValueError, match="entry_price must be positive"):
         sizer.calculate(entry_price=-100.0, total_capital=50000.0, max_positions=5)
+
+
+def test_per_trade_capital(sizer: PositionSizer) -> None:
+    assert sizer.per_trade_capital(total_capital=50000.0, max_positions=5) == 10000.0
+
+
+def test_per_trade_capital_zero_max_positions_raises(sizer: PositionSizer) -> None:
+    with pytest.raises(ValueError, match="max_positions must be positive"):
+        sizer.per_trade_capital(total_capital=50000.0, max_positions=0)
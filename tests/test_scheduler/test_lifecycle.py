@@ -1,6 +1,8 @@
 """Tests for SignalPilotApp lifecycle orchestrator."""
 
 import asyncio
+import logging
+import time
 from datetime import date, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,6 +20,7 @@ from signalpilot.db.models import (
 )
 from signalpilot.scheduler.lifecycle import SignalPilotApp
 from signalpilot.utils.constants import IST
+from signalpilot.utils.log_context import get_cycle_id, get_phase
 from signalpilot.utils.market_calendar import StrategyPhase
 
 
@@ -31,8 +34,11 @@ def _make_app(**overrides) -> SignalPilotApp:
         "metrics_calculator": AsyncMock(),
         "authenticator": AsyncMock(),
         "instruments": AsyncMock(),
-        "market_data": MagicMock(),
-        "historical": AsyncMock(),
+        "market_data": MagicMock(set_historical_many=AsyncMock()),
+        "historical": AsyncMock(
+            fetch_previous_day_data=AsyncMock(return_value={}),
+            fetch_average_daily_volume=AsyncMock(return_value={}),
+        ),
         "websocket": AsyncMock(),
         "strategy": AsyncMock(),
         "ranker": MagicMock(),
@@ -92,6 +98,46 @@ async def test_startup_calls_all_init_methods() -> None:
     app._scheduler.start.assert_called_once()
 
 
+async def test_startup_stores_historical_references_in_one_batch() -> None:
+    """Only symbols with both previous-day data and ADV are stored."""
+    app = _make_app()
+    app._historical.fetch_previous_day_data.return_value = {
+        "SBIN": MagicMock(close=100.0, high=102.0),
+        "TCS": MagicMock(close=3500.0, high=3550.0),
+    }
+    app._historical.fetch_average_daily_volume.return_value = {"SBIN": 500000.0}
+
+    await app.startup()
+
+    app._market_data.set_historical_many.assert_awaited_once()
+    refs = app._market_data.set_historical_many.call_args.args[0]
+    assert list(refs) == ["SBIN"]
+    assert refs["SBIN"].previous_close == 100.0
+    assert refs["SBIN"].previous_high == 102.0
+    assert refs["SBIN"].average_daily_volume == 500000.0
+
+
+async def test_startup_runs_independent_branches_concurrently() -> None:
+    """Bot start should not wait behind the historical data fetch."""
+    app = _make_app()
+    bot_started = asyncio.Event()
+
+    async def start_bot():
+        bot_started.set()
+
+    async def fetch_previous_day_data():
+        await bot_started.wait()
+        return {}
+
+    app._bot.start = AsyncMock(side_effect=start_bot)
+    app._historical.fetch_previous_day_data = AsyncMock(side_effect=fetch_previous_day_data)
+
+    await asyncio.wait_for(app.startup(), timeout=1)
+
+    app._historical.fetch_average_daily_volume.assert_awaited_once()
+    app._scheduler.start.assert_called_once()
+
+
 async def test_startup_initializes_default_config() -> None:
     app = _make_app()
     await app.startup()
@@ -221,10 +267,10 @@ async def test_scan_loop_sends_signal_when_candidates_found() -> None:
     app._config_repo.get_user_config = AsyncMock(
         return_value=UserConfig(total_capital=50000.0, max_positions=5)
     )
-    app._trade_repo.get_active_trade_count = AsyncMock(return_value=0)
+    app._trade_repo.get_active_trades = AsyncMock(return_value=[])
     app._risk_manager.filter_and_size = MagicMock(return_value=[signal])
-    app._signal_repo.insert_signal = AsyncMock(return_value=1)
-    app._bot.send_signal = AsyncMock()
+    app._signal_repo.insert_signals = AsyncMock(return_value=[1])
+    app._bot.send_signals = AsyncMock()
     app._exit_monitor.check_all_trades = AsyncMock()
     app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
 
@@ -246,8 +292,308 @@ async def test_scan_loop_sends_signal_when_candidates_found() -> None:
         app._accepting_signals = True
         await app._scan_loop()
 
-    app._signal_repo.insert_signal.assert_awaited_once()
-    app._bot.send_signal.assert_awaited_once_with(signal)
+    app._signal_repo.insert_signals.assert_awaited_once()
+    app._bot.send_signals.assert_awaited_once_with([signal])
+
+
+async def test_scan_loop_derives_active_count_from_active_trades() -> None:
+    """The position limit should use len(active trades) without a separate COUNT query."""
+    trades = [
+        TradeRecord(id=1, symbol="SBIN", entry_price=100.0, stop_loss=97.0, quantity=10),
+        TradeRecord(id=2, symbol="TCS", entry_price=200.0, stop_loss=194.0, quantity=5),
+    ]
+    user_config = UserConfig(total_capital=50000.0, max_positions=5)
+
+    app = _make_app()
+    app._strategy.evaluate = AsyncMock(return_value=["candidate1"])
+    app._ranker.rank = MagicMock(return_value=["ranked1"])
+    app._config_repo.get_user_config = AsyncMock(return_value=user_config)
+    app._trade_repo.get_active_trades = AsyncMock(return_value=trades)
+    app._risk_manager.filter_and_size = MagicMock(return_value=[])
+    app._exit_monitor.check_trade = AsyncMock()
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.OPENING,
+    ), patch("asyncio.sleep", side_effect=mock_sleep):
+        app._scanning = True
+        app._accepting_signals = True
+        await app._scan_loop()
+
+    app._trade_repo.get_active_trades.assert_awaited_once()
+    app._trade_repo.get_active_trade_count.assert_not_awaited()
+    app._risk_manager.filter_and_size.assert_called_once_with(["ranked1"], user_config, 2)
+    assert app._exit_monitor.check_trade.await_count == 2
+
+
+async def test_persist_and_send_logs_send_failure(caplog: pytest.LogCaptureFixture) -> None:
+    """A Telegram failure should be logged, not raised, once signals are stored."""
+    first = _make_final_signal(symbol="SBIN")
+    second = _make_final_signal(symbol="TCS")
+
+    app = _make_app()
+    app._signal_repo.insert_signals = AsyncMock(return_value=[1, 2])
+    app._bot.send_signals = AsyncMock(side_effect=RuntimeError("telegram down"))
+
+    now = datetime(2025, 1, 6, 9, 35, 0, tzinfo=IST)
+    await app._persist_and_send([first, second], now)
+
+    records = app._signal_repo.insert_signals.call_args.args[0]
+    assert [r.symbol for r in records] == ["SBIN", "TCS"]
+    assert [r.id for r in records] == [1, 2]
+    app._bot.send_signals.assert_awaited_once_with([first, second])
+    assert "Failed to send 2 signal(s): SBIN, TCS" in caplog.text
+
+
+async def test_persist_and_send_overlaps_insert_and_send() -> None:
+    """The Telegram send should not wait for the DB insert to complete."""
+    signal = _make_final_signal()
+    sent = asyncio.Event()
+
+    async def insert_signals(records):
+        await sent.wait()
+        return [1]
+
+    async def send_signals(signals):
+        sent.set()
+
+    app = _make_app()
+    app._signal_repo.insert_signals = AsyncMock(side_effect=insert_signals)
+    app._bot.send_signals = AsyncMock(side_effect=send_signals)
+
+    now = datetime(2025, 1, 6, 9, 35, 0, tzinfo=IST)
+    await asyncio.wait_for(app._persist_and_send([signal], now), timeout=1)
+
+    app._bot.send_signals.assert_awaited_once_with([signal])
+
+
+async def test_persist_and_send_raises_on_insert_failure() -> None:
+    app = _make_app()
+    app._signal_repo.insert_signals = AsyncMock(side_effect=RuntimeError("db locked"))
+    app._bot.send_signals = AsyncMock()
+
+    now = datetime(2025, 1, 6, 9, 35, 0, tzinfo=IST)
+    with pytest.raises(RuntimeError, match="db locked"):
+        await app._persist_and_send([_make_final_signal()], now)
+
+
+async def test_scan_loop_throttle_subtracts_work_time() -> None:
+    """Time spent on iteration work should be subtracted from the throttle sleep."""
+    app = _make_app()
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+
+    sleeps: list[float] = []
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        sleeps.append(seconds)
+        app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.CONTINUOUS,
+    ), patch("asyncio.sleep", side_effect=mock_sleep), patch(
+        "signalpilot.scheduler.lifecycle.time"
+    ) as mock_time:
+        mock_time.monotonic.side_effect = [100.0, 100.1]
+        app._scanning = True
+        await app._scan_loop()
+
+    assert sleeps == [pytest.approx(0.15)]
+
+
+async def test_wait_for_tick_returns_when_notified() -> None:
+    app = _make_app()
+    loop = asyncio.get_running_loop()
+    loop.call_soon(app.notify_tick)
+
+    await asyncio.wait_for(app._wait_for_tick(time.monotonic() + 60), timeout=1)
+
+    assert not app._tick_event.is_set()
+
+
+async def test_wait_for_tick_times_out_at_deadline() -> None:
+    app = _make_app()
+
+    await asyncio.wait_for(app._wait_for_tick(time.monotonic() + 0.01), timeout=1)
+
+    assert not app._tick_event.is_set()
+
+
+async def test_check_exits_isolates_failing_trade(caplog: pytest.LogCaptureFixture) -> None:
+    """One trade's exit check raising should not stop the others."""
+    trades = [
+        TradeRecord(id=1, symbol="SBIN", entry_price=100.0, stop_loss=97.0, quantity=10),
+        TradeRecord(id=2, symbol="TCS", entry_price=200.0, stop_loss=194.0, quantity=5),
+    ]
+    app = _make_app()
+    app._exit_monitor.check_trade = AsyncMock(side_effect=[RuntimeError("no tick"), None])
+
+    await app._check_exits(trades)
+
+    assert app._exit_monitor.check_trade.await_count == 2
+    assert "Exit check failed for trade 1 (SBIN)" in caplog.text
+
+
+async def test_check_exits_bounds_concurrency() -> None:
+    trades = [
+        TradeRecord(id=i, symbol=f"S{i}", entry_price=100.0, stop_loss=97.0, quantity=1)
+        for i in range(20)
+    ]
+    app = _make_app()
+    in_flight = 0
+    peak = 0
+
+    async def check_trade(trade):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    app._exit_monitor.check_trade = AsyncMock(side_effect=check_trade)
+
+    await app._check_exits(trades)
+
+    assert app._exit_monitor.check_trade.await_count == 20
+    assert 1 < peak <= 8
+
+
+async def test_scan_loop_logs_step_timings_at_debug(caplog) -> None:
+    app = _make_app()
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    app._trade_repo.get_active_trades = AsyncMock(return_value=[])
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.WIND_DOWN,
+    ), patch("asyncio.sleep", side_effect=mock_sleep), caplog.at_level(
+        logging.DEBUG, logger="signalpilot.scheduler.lifecycle"
+    ):
+        app._scanning = True
+        await app._scan_loop()
+
+    timing_logs = [r.getMessage() for r in caplog.records if "Cycle timings" in r.getMessage()]
+    assert len(timing_logs) == 1
+    assert "active_trades=" in timing_logs[0]
+    assert "check_exits=" in timing_logs[0]
+    assert "expire=" in timing_logs[0]
+
+
+async def _run_one_scan_cycle(app: SignalPilotApp, phase: StrategyPhase) -> list[float]:
+    """Run a single scan iteration and return the durations passed to asyncio.sleep."""
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    sleeps: list[float] = []
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        sleeps.append(seconds)
+        app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase", return_value=phase
+    ), patch("asyncio.sleep", side_effect=mock_sleep), patch(
+        "signalpilot.scheduler.lifecycle.time"
+    ) as mock_time:
+        mock_time.monotonic.side_effect = [100.0, 100.0]
+        app._scanning = True
+        await app._scan_loop()
+    return sleeps
+
+
+async def test_scan_loop_idles_without_open_trades_outside_signal_phases() -> None:
+    app = _make_app()
+    app._trade_repo.get_active_trades = AsyncMock(return_value=[])
+    app._wait_for_tick = AsyncMock()
+
+    sleeps = await _run_one_scan_cycle(app, StrategyPhase.CONTINUOUS)
+
+    assert sleeps == [app._idle_scan_interval]
+    app._wait_for_tick.assert_not_awaited()
+
+
+async def test_scan_loop_follows_ticks_while_trades_are_open() -> None:
+    app = _make_app()
+    app._trade_repo.get_active_trades = AsyncMock(return_value=[MagicMock(id=1)])
+    app._exit_monitor.check_trade = AsyncMock()
+    app._scanning = True
+
+    async def wait_for_tick(deadline):
+        app._scanning = False
+
+    app._wait_for_tick = AsyncMock(side_effect=wait_for_tick)
+    sleeps: list[float] = []
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        sleeps.append(seconds)
+        await original_sleep(0)
+
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.CONTINUOUS,
+    ), patch("asyncio.sleep", side_effect=mock_sleep), patch(
+        "signalpilot.scheduler.lifecycle.time"
+    ) as mock_time:
+        mock_time.monotonic.side_effect = [100.0, 100.0]
+        await app._scan_loop()
+
+    assert sleeps == [app._min_scan_interval]
+    app._wait_for_tick.assert_awaited_once_with(100.0 + app._scan_interval)
+
+
+async def test_scan_loop_cycle_ids_are_sequential() -> None:
+    """Each iteration logs under its own cycle id and phase, cleared afterwards."""
+    app = _make_app()
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    seen: list[tuple[str | None, str | None]] = []
+
+    async def get_active_trades():
+        seen.append((get_cycle_id(), get_phase()))
+        return []
+
+    app._trade_repo.get_active_trades = get_active_trades
+
+    call_count = 0
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        nonlocal call_count
+        call_count += 1
+        if call_count >= 2:
+            app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.CONTINUOUS,
+    ), patch("asyncio.sleep", side_effect=mock_sleep), patch.object(
+        app, "_wait_for_tick", new_callable=AsyncMock
+    ):
+        app._scanning = True
+        await app._scan_loop()
+
+    phase = StrategyPhase.CONTINUOUS.value
+    prefix = app._cycle_prefix
+    assert len(prefix) == 4
+    assert seen == [(f"{prefix}000001", phase), (f"{prefix}000002", phase)]
+    assert get_cycle_id() is None
+    assert get_phase() is None
 
 
 # -- stop_new_signals ----------------------------------------------------------
@@ -343,6 +689,27 @@ async def test_shutdown_cancels_scan_task() -> None:
     assert app._scan_task.cancelled()
 
 
+async def test_shutdown_cancels_every_tracked_scan_task() -> None:
+    """A scan task replaced by a second start_scanning call is still cancelled."""
+    app = _make_app()
+
+    async def fake_scan():
+        await asyncio.sleep(100)
+
+    with patch.object(app, "_scan_loop", side_effect=fake_scan):
+        await app.start_scanning()
+        first = app._scan_task
+        await app.start_scanning()
+        second = app._scan_task
+
+    assert app._scan_tasks == {first, second}
+    await app.shutdown()
+
+    assert first.cancelled()
+    assert second.cancelled()
+    assert app._scan_tasks == set()
+
+
 # -- recover -------------------------------------------------------------------
 
 
@@ -392,6 +759,46 @@ async def test_expire_stale_signals_delegates_to_repo() -> None:
     app._signal_repo.expire_stale_signals.assert_awaited_once()
 
 
+async def test_expire_stale_signals_uses_given_now() -> None:
+    app = _make_app()
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    now = datetime(2025, 1, 6, 10, 0, 0, tzinfo=IST)
+
+    await app._expire_stale_signals(now)
+
+    app._signal_repo.expire_stale_signals.assert_awaited_once_with(now)
+
+
+async def test_scan_loop_expires_signals_on_lower_cadence() -> None:
+    """The expiry sweep runs on the first cycle, then once per _expiry_interval."""
+    app = _make_app()
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    app._trade_repo.get_active_trades = AsyncMock(return_value=[])
+    app._exit_monitor.check_trade = AsyncMock()
+    ticks = iter([100.0, 100.0, 101.0, 101.0, 131.0, 131.0])
+    original_sleep = asyncio.sleep
+    sleep_count = 0
+
+    async def mock_sleep(seconds):
+        nonlocal sleep_count
+        sleep_count += 1
+        if sleep_count >= 3:
+            app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.WIND_DOWN,
+    ), patch("asyncio.sleep", side_effect=mock_sleep), patch(
+        "signalpilot.scheduler.lifecycle.time"
+    ) as mock_time, patch.object(app, "_wait_for_tick", new_callable=AsyncMock):
+        mock_time.monotonic.side_effect = lambda: next(ticks)
+        app._scanning = True
+        await app._scan_loop()
+
+    assert app._signal_repo.expire_stale_signals.await_count == 2
+
+
 # -- _signal_to_record ---------------------------------------------------------
 
 
@@ -484,6 +891,93 @@ async def test_scan_loop_circuit_breaker_stops_after_max_errors() -> None:
     assert "repeated errors" in app._bot.send_alert.call_args[0][0].lower()
 
 
+async def _run_scan_loop_with_clock(app: SignalPilotApp, step: float, max_sleeps: int) -> None:
+    """Run the scan loop with a fake monotonic clock advancing *step* per read."""
+    clock = [0.0]
+
+    def monotonic() -> float:
+        clock[0] += step
+        return clock[0]
+
+    original_sleep = asyncio.sleep
+    sleep_count = 0
+
+    async def mock_sleep(seconds):
+        nonlocal sleep_count
+        sleep_count += 1
+        if sleep_count >= max_sleeps:
+            app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.WIND_DOWN,
+    ), patch("asyncio.sleep", side_effect=mock_sleep), patch(
+        "signalpilot.scheduler.lifecycle.time"
+    ) as mock_time, patch.object(app, "_wait_for_tick", new_callable=AsyncMock):
+        mock_time.monotonic.side_effect = monotonic
+        app._scanning = True
+        await app._scan_loop()
+
+
+async def test_scan_loop_circuit_breaker_counts_intermittent_errors_in_window() -> None:
+    """Errors separated by successful cycles still trip the breaker within the window."""
+    app = _make_app()
+    app._max_consecutive_errors = 3
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    app._trade_repo.get_active_trades = AsyncMock(
+        side_effect=[RuntimeError("flaky"), [], RuntimeError("flaky"), [], RuntimeError("flaky")]
+    )
+
+    await _run_scan_loop_with_clock(app, step=1.0, max_sleeps=10)
+
+    assert app._trade_repo.get_active_trades.await_count == 5
+    app._bot.send_alert.assert_awaited_once()
+
+
+async def test_scan_loop_circuit_breaker_ignores_errors_outside_window() -> None:
+    """Errors spread further apart than the window never trip the breaker."""
+    app = _make_app()
+    app._max_consecutive_errors = 3
+    app._trade_repo.get_active_trades = AsyncMock(side_effect=RuntimeError("slow failure"))
+
+    await _run_scan_loop_with_clock(app, step=30.0, max_sleeps=6)
+
+    assert app._trade_repo.get_active_trades.await_count == 6
+    app._bot.send_alert.assert_not_awaited()
+
+
+async def test_scan_loop_backs_off_exponentially_after_errors() -> None:
+    """Consecutive errors double the pause before the next cycle, up to the cap."""
+    app = _make_app()
+    app._max_consecutive_errors = 100
+    app._signal_repo.expire_stale_signals = AsyncMock(return_value=0)
+    app._trade_repo.get_active_trades = AsyncMock(
+        side_effect=[RuntimeError("down")] * 6 + [[MagicMock(id=1)]]
+    )
+    app._exit_monitor.check_trade = AsyncMock()
+    app._wait_for_tick = AsyncMock()
+    sleeps: list[float] = []
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) >= 7:
+            app._scanning = False
+        await original_sleep(0)
+
+    with patch(
+        "signalpilot.scheduler.lifecycle.get_current_phase",
+        return_value=StrategyPhase.WIND_DOWN,
+    ), patch("asyncio.sleep", side_effect=mock_sleep):
+        app._scanning = True
+        await app._scan_loop()
+
+    assert sleeps[:6] == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+    # A successful cycle resets the backoff to the normal throttle
+    assert sleeps[6] <= app._min_scan_interval
+
+
 # -- shutdown resilience -------------------------------------------------------
 
 
@@ -499,6 +993,49 @@ async def test_shutdown_continues_if_websocket_disconnect_fails() -> None:
     app._scheduler.shutdown.assert_called_once()
 
 
+async def test_shutdown_closes_db_after_websocket_and_bot() -> None:
+    """Websocket and bot close together; the database waits for both."""
+    app = _make_app()
+    order: list[str] = []
+    bot_stopped = asyncio.Event()
+
+    async def disconnect():
+        # Would deadlock if the bot were only stopped after the websocket closed
+        await bot_stopped.wait()
+        order.append("websocket")
+
+    async def stop_bot():
+        order.append("bot")
+        bot_stopped.set()
+
+    async def close_db():
+        order.append("db")
+
+    app._websocket.disconnect = AsyncMock(side_effect=disconnect)
+    app._bot.stop = AsyncMock(side_effect=stop_bot)
+    app._db.close = AsyncMock(side_effect=close_db)
+
+    await asyncio.wait_for(app.shutdown(), timeout=1)
+
+    assert order == ["bot", "websocket", "db"]
+
+
+async def test_close_components_times_out_hung_step(caplog) -> None:
+    """A component that never finishes closing is abandoned after the timeout."""
+    hang = asyncio.Event()
+    bot_stop = AsyncMock()
+
+    await asyncio.wait_for(
+        SignalPilotApp._close_components(
+            [("websocket", hang.wait()), ("bot", bot_stop())], timeout=0.05
+        ),
+        timeout=1,
+    )
+
+    bot_stop.assert_awaited_once()
+    assert "Timed out shutting down websocket" in caplog.text
+
+
 # -- recover phase check -------------------------------------------------------
 
 
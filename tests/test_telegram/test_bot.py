@@ -5,6 +5,7 @@ requiring a real Telegram connection. python-telegram-bot's Application
 is mocked.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,7 +20,8 @@ from signalpilot.db.models import (
     SignalDirection,
     TradeRecord,
 )
-from signalpilot.telegram.bot import SignalPilotBot
+from signalpilot.telegram.bot import _COMMAND_PATTERN, SignalPilotBot
+from signalpilot.utils.circuit_breaker import CircuitOpenError
 from signalpilot.utils.constants import IST
 
 
@@ -80,11 +82,41 @@ async def test_send_signal_calls_bot() -> None:
 
     mock_send.assert_called_once()
     call_kwargs = mock_send.call_args
-    assert call_kwargs.kwargs["chat_id"] == "123456"
+    assert call_kwargs.kwargs["chat_id"] == 123456
     assert call_kwargs.kwargs["parse_mode"] == "HTML"
     assert "BUY SIGNAL" in call_kwargs.kwargs["text"]
 
 
+@pytest.mark.asyncio
+async def test_send_signals_combines_into_one_message() -> None:
+    """send_signals should deliver several signals in a single send_message call."""
+    bot = _make_bot()
+    mock_send = AsyncMock()
+    bot._application = MagicMock()
+    bot._application.bot.send_message = mock_send
+
+    await bot.send_signals([_make_final_signal(), _make_final_signal()])
+
+    mock_send.assert_called_once()
+    assert mock_send.call_args.kwargs["text"].count("BUY SIGNAL") == 2
+    assert mock_send.call_args.kwargs["parse_mode"] == "HTML"
+
+
+@pytest.mark.asyncio
+async def test_send_signals_splits_at_message_limit() -> None:
+    """Signals that would overflow one Telegram message go out in several."""
+    bot = _make_bot()
+    mock_send = AsyncMock()
+    bot._application = MagicMock()
+    bot._application.bot.send_message = mock_send
+
+    with patch("signalpilot.telegram.bot.format_signal_message", return_value="x" * 3000):
+        await bot.send_signals([_make_final_signal(), _make_final_signal()])
+
+    assert mock_send.call_count == 2
+    assert all(len(c.kwargs["text"]) <= 4096 for c in mock_send.call_args_list)
+
+
 @pytest.mark.asyncio
 async def test_send_alert_calls_bot() -> None:
     """send_alert should send plain text to chat_id."""
@@ -97,7 +129,24 @@ async def test_send_alert_calls_bot() -> None:
 
     mock_send.assert_called_once()
     assert mock_send.call_args.kwargs["text"] == "Test alert"
-    assert mock_send.call_args.kwargs["chat_id"] == "123456"
+    assert mock_send.call_args.kwargs["chat_id"] == 123456
+
+
+@pytest.mark.asyncio
+async def test_send_alert_fails_fast_while_circuit_open() -> None:
+    """After repeated send failures, further sends are short-circuited."""
+    bot = _make_bot()
+    mock_send = AsyncMock(side_effect=RuntimeError("telegram down"))
+    bot._application = MagicMock()
+    bot._application.bot.send_message = mock_send
+
+    for _ in range(5):
+        with pytest.raises(RuntimeError, match="telegram down"):
+            await bot.send_alert("Test alert")
+
+    with pytest.raises(CircuitOpenError):
+        await bot.send_alert("Test alert")
+    assert mock_send.await_count == 5
 
 
 @pytest.mark.asyncio
@@ -121,6 +170,75 @@ async def test_send_exit_alert_formats_and_sends() -> None:
     assert "SBIN" in text
 
 
+@pytest.mark.asyncio
+async def test_exit_alert_burst_is_coalesced_while_running() -> None:
+    """Exit alerts queued together go out as one message; stop() flushes the queue."""
+    bot = _make_bot()
+    mock_send = AsyncMock()
+    bot._application = MagicMock()
+    bot._application.bot.send_message = mock_send
+    bot._application.updater.stop = AsyncMock()
+    bot._application.stop = AsyncMock()
+    bot._application.shutdown = AsyncMock()
+    bot._exit_alert_task = asyncio.create_task(bot._flush_exit_alerts())
+
+    for trade_id, symbol in enumerate(["SBIN", "TCS", "INFY"], start=1):
+        trade = TradeRecord(
+            id=trade_id, symbol=symbol, entry_price=100.0, stop_loss=97.0, quantity=10
+        )
+        await bot.send_exit_alert(
+            ExitAlert(
+                trade=trade, exit_type=ExitType.TIME_EXIT,
+                current_price=101.0, pnl_pct=1.0, is_alert_only=False,
+            )
+        )
+    mock_send.assert_not_called()
+
+    await bot.stop()
+
+    mock_send.assert_awaited_once()
+    text = mock_send.call_args.kwargs["text"]
+    assert all(symbol in text for symbol in ("SBIN", "TCS", "INFY"))
+    assert bot._exit_alert_task is None
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("taken", "taken"),
+        ("STATUS", "status"),
+        ("Journal", "journal"),
+        ("help", "help"),
+        ("capital 50000", "capital"),
+        ("CAPITAL 25000.50", "capital"),
+        ("capital", None),
+        ("capital abc", None),
+        ("taken now", None),
+        ("hello", None),
+    ],
+)
+def test_command_pattern(text: str, expected: str | None) -> None:
+    match = _COMMAND_PATTERN.match(text)
+    if expected is None:
+        assert match is None
+    else:
+        assert match is not None
+        assert (match["command"] or match["capital"]).lower() == expected
+
+
+@pytest.mark.asyncio
+async def test_route_command_dispatches_to_handler() -> None:
+    bot = _make_bot()
+    handler = AsyncMock()
+    bot._commands["capital"] = handler
+    update = MagicMock()
+    context = MagicMock(matches=[_COMMAND_PATTERN.match("Capital 50000")])
+
+    await bot._route_command(update, context)
+
+    handler.assert_awaited_once_with(update, context)
+
+
 @pytest.mark.asyncio
 async def test_latency_warning_logged(caplog: pytest.LogCaptureFixture) -> None:
     """Signal delivery > 30s should log a warning."""
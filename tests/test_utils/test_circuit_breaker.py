@@ -0,0 +1,81 @@
+"""Tests for CircuitBreaker."""
+
+from unittest.mock import patch
+
+from signalpilot.utils.circuit_breaker import CircuitBreaker
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker("test", failure_threshold=3, reset_timeout=30.0)
+
+
+def test_starts_closed() -> None:
+    breaker = _breaker()
+    assert breaker.state == "closed"
+    assert breaker.allow() is True
+
+
+def test_opens_after_threshold_consecutive_failures() -> None:
+    breaker = _breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow() is True
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+
+
+def test_success_resets_failure_count() -> None:
+    breaker = _breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_after_reset_timeout() -> None:
+    breaker = _breaker()
+    with patch("signalpilot.utils.circuit_breaker.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        for _ in range(3):
+            breaker.record_failure()
+
+        mock_time.monotonic.return_value = 129.9
+        assert breaker.allow() is False
+
+        mock_time.monotonic.return_value = 130.0
+        assert breaker.state == "half_open"
+        assert breaker.allow() is True
+
+
+def test_half_open_probe_success_closes() -> None:
+    breaker = _breaker()
+    with patch("signalpilot.utils.circuit_breaker.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        for _ in range(3):
+            breaker.record_failure()
+        mock_time.monotonic.return_value = 130.0
+
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+
+
+def test_half_open_probe_failure_reopens() -> None:
+    breaker = _breaker()
+    with patch("signalpilot.utils.circuit_breaker.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        for _ in range(3):
+            breaker.record_failure()
+        mock_time.monotonic.return_value = 130.0
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        mock_time.monotonic.return_value = 159.0
+        assert breaker.allow() is False
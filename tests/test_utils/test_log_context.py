@@ -14,6 +14,7 @@ from signalpilot.utils.log_context import (
     log_context,
     reset_context,
     set_context,
+    with_job_context,
 )
 from signalpilot.utils.logger import configure_logging
 
@@ -128,6 +129,48 @@ class TestLogContext:
                 pass
 
 
+class TestWithJobContext:
+    def teardown_method(self):
+        reset_context()
+
+    async def test_sets_job_name_during_call(self):
+        @with_job_context("daily_summary")
+        async def job():
+            return get_job_name()
+
+        assert await job() == "daily_summary"
+        assert get_job_name() is None
+
+    async def test_restores_outer_job_name(self):
+        @with_job_context("inner")
+        async def inner():
+            return get_job_name()
+
+        @with_job_context("outer")
+        async def outer():
+            seen = await inner()
+            return seen, get_job_name()
+
+        assert await outer() == ("inner", "outer")
+
+    async def test_resets_on_exception(self):
+        @with_job_context("failing")
+        async def job():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await job()
+        assert get_job_name() is None
+
+    def test_preserves_function_metadata(self):
+        @with_job_context("x")
+        async def documented():
+            """Docstring."""
+
+        assert documented.__name__ == "documented"
+        assert documented.__doc__ == "Docstring."
+
+
 class TestFormatterIntegration:
     def teardown_method(self):
         reset_context()